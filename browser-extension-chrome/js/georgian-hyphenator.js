@@ -27,6 +27,9 @@ if ( typeof window !== 'undefined' && typeof window.GeorgianHyphenator === 'unde
 
 	    this.dictionary = new Map();
 	    this.dictionaryLoaded = false;
+
+	    // Fingerprint of data loaded with loadCompactLibrary() (null otherwise)
+	    this.dataFingerprint = null;
 	  }
 
 	  /**
@@ -54,6 +57,101 @@ if ( typeof window !== 'undefined' && typeof window.GeorgianHyphenator === 'unde
 	    }
 	  }
 
+	  /**
+	   * ტვირთავს კომპაქტურ ლექსიკონს (data/exceptions.ghd)
+	   *
+	   * Loads the artifact written by the Python exporter
+	   * (python -m georgian_hyphenation.compact): dictionary + harmonic
+	   * clusters, front-coded with break bitmasks, no JSON parsing. The
+	   * artifact's cluster set replaces the current one.
+	   *
+	   * @param {ArrayBuffer|Uint8Array|string} data - Artifact bytes, or base64 text
+	   * @returns {string} Data fingerprint (also stored as this.dataFingerprint)
+	   */
+	  loadCompactLibrary(data) {
+	    let bytes;
+	    if (typeof data === 'string') {
+	      const binary = atob(data);
+	      bytes = new Uint8Array(binary.length);
+	      for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+	    } else {
+	      bytes = data instanceof Uint8Array ? data : new Uint8Array(data);
+	    }
+
+	    const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+	    if (bytes.length < 28 || String.fromCharCode(bytes[0], bytes[1], bytes[2], bytes[3]) !== 'GHCD'
+	        || bytes[4] !== 1) {
+	      throw new Error('Not a compact hyphenation dictionary (or wrong version)');
+	    }
+	    const clusterCount = view.getUint16(6, true);
+	    const entryCount = view.getUint32(8, true);
+	    const fingerprint = String.fromCharCode(...bytes.subarray(12, 28));
+
+	    // Letter bytes: U+10D0 + (byte - 1); 0 is '-' in explicit values.
+	    // Decode the whole buffer into one string once; keys and values are
+	    // then plain slices of it (much cheaper than per-letter concatenation
+	    // while the function still runs unoptimized).
+	    const codes = new Uint16Array(bytes.length);
+	    for (let i = 0; i < bytes.length; i++) {
+	      codes[i] = bytes[i] === 0 ? 0x2D : 0x10CF + bytes[i];
+	    }
+	    let decoded = '';
+	    for (let i = 0; i < codes.length; i += 8192) {
+	      decoded += String.fromCharCode.apply(null, codes.subarray(i, i + 8192));
+	    }
+
+	    let pos = 28;
+	    const clusters = new Set();
+	    for (let i = 0; i < clusterCount; i++, pos += 2) {
+	      clusters.add(decoded.slice(pos, pos + 2));
+	    }
+
+	    let word = '';
+	    for (let i = 0; i < entryCount; i++) {
+	      const shared = bytes[pos];
+	      const length = bytes[pos + 1];
+	      word = word.slice(0, shared) + decoded.slice(pos + 2, pos + 2 + length);
+	      pos += 2 + length;
+
+	      let hyphenated;
+	      if (bytes[pos] === 1) {
+	        // Explicit value (it does not spell the key)
+	        const end = pos + 2 + bytes[pos + 1];
+	        hyphenated = decoded.slice(pos + 2, end);
+	        pos = end;
+	      } else {
+	        // Varint of (mask << 1): bit n (n >= 1) = break before letter n - 1
+	        hyphenated = '';
+	        let previous = 0;
+	        let base = -1;
+	        let byte;
+	        do {
+	          byte = bytes[pos++];
+	          let bits = byte & 0x7F;
+	          while (bits) {
+	            const low = bits & -bits;
+	            const cut = base + 31 - Math.clz32(low);
+	            if (cut >= 0) {
+	              hyphenated += word.slice(previous, cut) + '-';
+	              previous = cut;
+	            }
+	            bits ^= low;
+	          }
+	          base += 7;
+	        } while (byte & 0x80);
+	        hyphenated += word.slice(previous);
+	      }
+	      this.dictionary.set(word, hyphenated);
+	    }
+
+	    this.harmonicClusters = clusters;
+	    this.dataFingerprint = fingerprint;
+	    if (this.debug) {
+	      console.log(`Georgian Hyphenation: compact dictionary loaded (${entryCount} words, ${fingerprint})`);
+	    }
+	    return fingerprint;
+	  }
+
 	  /**
 	   * ტვირთავს default dictionary-ს
 	   *
@@ -1,4 +1,4 @@
-/* GENERATED — Georgian Hyphenation exception dictionary (v2.3.0). */
+/* GENERATED — Georgian Hyphenation exception dictionary (v2.3.0, data 33eaacdc50ef3bfc). */
 if ( typeof window !== 'undefined' ) { window.GEORGIAN_HYPHENATION_DICT = {
   "კომპიუტერი": "კომ-პიუ-ტე-რი",
   "ფეისბუქი": "ფეის-ბუ-ქი",
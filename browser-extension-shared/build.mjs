@@ -111,9 +111,25 @@ ${ body }
 async function buildDictionary() {
 	const src = fileURLToPath( new URL( 'npm/data/exceptions.json', root ) );
 	const json = await readFile( src, 'utf8' );
+
+	// The compact artifact (npm/data/exceptions.ghd, written by
+	// python -m georgian_hyphenation.compact) must hold the same data, so
+	// every runtime reports the same data fingerprint. The bundles keep
+	// the object literal: for a dictionary this size, evaluating it on a
+	// cold page is cheaper than decoding the artifact.
+	const artifact = await readFile( fileURLToPath( new URL( 'npm/data/exceptions.ghd', root ) ) );
+	const { default: GeorgianHyphenator } = await import( new URL( 'npm/src/javascript/index.js', root ) );
+	const compact = new GeorgianHyphenator();
+	const fingerprint = compact.loadCompactLibrary( artifact );
+	const entries = ( data ) => JSON.stringify( Object.entries( data ).sort() );
+	if ( entries( compact.exportDictionary() ) !== entries( JSON.parse( json ) ) ) {
+		throw new Error( 'npm/data/exceptions.ghd is stale; regenerate it with: '
+			+ 'python -m georgian_hyphenation.compact npm/data/exceptions.json -o npm/data/exceptions.ghd' );
+	}
+
 	// Assign to the content-script isolated-world global; no fetch, no
 	// web_accessible_resources needed.
-	return `/* GENERATED — Georgian Hyphenation exception dictionary (v${ VERSION }). */\n`
+	return `/* GENERATED — Georgian Hyphenation exception dictionary (v${ VERSION }, data ${ fingerprint }). */\n`
 		+ `if ( typeof window !== 'undefined' ) { window.GEORGIAN_HYPHENATION_DICT = ${ json.trim() }; }\n`;
 }
 
@@ -16,8 +16,10 @@ declare class GeorgianHyphenator {
   harmonicClusters: Set<string>;
   dictionary: Map<string, string>;
   dictionaryLoaded: boolean;
+  dataFingerprint: string | null;
 
   loadLibrary(data: Record<string, string>): void;
+  loadCompactLibrary(data: ArrayBuffer | Uint8Array | string): string;
   loadDefaultLibrary(source?: string): Promise<void>;
   hyphenate(word: string): string;
   applyAlgorithm(word: string): string;
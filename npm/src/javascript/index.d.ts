@@ -21,10 +21,22 @@ export default class GeorgianHyphenator {
   harmonicClusters: Set<string>;
   dictionary: Map<string, string>;
   dictionaryLoaded: boolean;
+  /** Fingerprint of data loaded with loadCompactLibrary() (null otherwise) */
+  dataFingerprint: string | null;
 
   /** Load a custom exception dictionary ({ word: "hy-phen-at-ed" }) */
   loadLibrary(data: Record<string, string>): void;
 
+  /**
+   * Load a compact dictionary artifact (data/exceptions.ghd, written by
+   * python -m georgian_hyphenation.compact); replaces the cluster set.
+   * @param data Artifact bytes, or base64 text
+   * @returns The data fingerprint
+   * @throws If the data is not a compact dictionary or its payload does not
+   *         match the fingerprint in the header
+   */
+  loadCompactLibrary(data: ArrayBuffer | Uint8Array | string): string;
+
   /**
    * Load the bundled exception dictionary.
    * @param source Optional custom URL (browser) or file path (Node.js)
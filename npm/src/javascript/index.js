@@ -25,6 +25,9 @@ export default class GeorgianHyphenator {
 
     this.dictionary = new Map();
     this.dictionaryLoaded = false;
+
+    // Fingerprint of data loaded with loadCompactLibrary() (null otherwise)
+    this.dataFingerprint = null;
   }
 
   /**
@@ -52,6 +55,155 @@ export default class GeorgianHyphenator {
     }
   }
 
+  /**
+   * ტვირთავს კომპაქტურ ლექსიკონს (data/exceptions.ghd)
+   *
+   * Loads the artifact written by the Python exporter
+   * (python -m georgian_hyphenation.compact): dictionary + harmonic
+   * clusters, front-coded with break bitmasks, no JSON parsing. The
+   * artifact's cluster set replaces the current one.
+   *
+   * @param {ArrayBuffer|Uint8Array|string} data - Artifact bytes, or base64 text
+   * @returns {string} Data fingerprint (also stored as this.dataFingerprint)
+   */
+  loadCompactLibrary(data) {
+    let bytes;
+    if (typeof data === 'string') {
+      const binary = atob(data);
+      bytes = new Uint8Array(binary.length);
+      for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+    } else {
+      bytes = data instanceof Uint8Array ? data : new Uint8Array(data);
+    }
+
+    const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+    if (bytes.length < 28 || String.fromCharCode(bytes[0], bytes[1], bytes[2], bytes[3]) !== 'GHCD'
+        || bytes[4] !== 1) {
+      throw new Error('Not a compact hyphenation dictionary (or wrong version)');
+    }
+    const clusterCount = view.getUint16(6, true);
+    const entryCount = view.getUint32(8, true);
+    const fingerprint = String.fromCharCode(...bytes.subarray(12, 28));
+    if (this._sha256Hex(bytes.subarray(28)).slice(0, 16) !== fingerprint) {
+      throw new Error('Compact dictionary is corrupt (fingerprint mismatch)');
+    }
+
+    // Letter bytes: U+10D0 + (byte - 1); 0 is '-' in explicit values.
+    // Decode the whole buffer into one string once; keys and values are
+    // then plain slices of it (much cheaper than per-letter concatenation
+    // while the function still runs unoptimized).
+    const codes = new Uint16Array(bytes.length);
+    for (let i = 0; i < bytes.length; i++) {
+      codes[i] = bytes[i] === 0 ? 0x2D : 0x10CF + bytes[i];
+    }
+    let decoded = '';
+    for (let i = 0; i < codes.length; i += 8192) {
+      decoded += String.fromCharCode.apply(null, codes.subarray(i, i + 8192));
+    }
+
+    let pos = 28;
+    const clusters = new Set();
+    for (let i = 0; i < clusterCount; i++, pos += 2) {
+      clusters.add(decoded.slice(pos, pos + 2));
+    }
+
+    let word = '';
+    for (let i = 0; i < entryCount; i++) {
+      const shared = bytes[pos];
+      const length = bytes[pos + 1];
+      word = word.slice(0, shared) + decoded.slice(pos + 2, pos + 2 + length);
+      pos += 2 + length;
+
+      let hyphenated;
+      if (bytes[pos] === 1) {
+        // Explicit value (it does not spell the key)
+        const end = pos + 2 + bytes[pos + 1];
+        hyphenated = decoded.slice(pos + 2, end);
+        pos = end;
+      } else {
+        // Varint of (mask << 1): bit n (n >= 1) = break before letter n - 1
+        hyphenated = '';
+        let previous = 0;
+        let base = -1;
+        let byte;
+        do {
+          byte = bytes[pos++];
+          let bits = byte & 0x7F;
+          while (bits) {
+            const low = bits & -bits;
+            const cut = base + 31 - Math.clz32(low);
+            if (cut >= 0) {
+              hyphenated += word.slice(previous, cut) + '-';
+              previous = cut;
+            }
+            bits ^= low;
+          }
+          base += 7;
+        } while (byte & 0x80);
+        hyphenated += word.slice(previous);
+      }
+      this.dictionary.set(word, hyphenated);
+    }
+
+    this.harmonicClusters = clusters;
+    this.dataFingerprint = fingerprint;
+    if (this.debug) {
+      console.log(`Georgian Hyphenation: compact dictionary loaded (${entryCount} words, ${fingerprint})`);
+    }
+    return fingerprint;
+  }
+
+  /**
+   * SHA-256 of a byte array as hex (synchronous, so it works in the
+   * browser without crypto.subtle)
+   */
+  _sha256Hex(bytes) {
+    const k = new Uint32Array([
+      0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+      0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+      0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+      0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+      0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+      0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+      0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+      0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+    ]);
+    const h = new Uint32Array([
+      0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
+    ]);
+
+    // Padding: 0x80, zeros, then the bit length as a 64-bit big-endian integer
+    const length = bytes.length;
+    const padded = new Uint8Array(((length + 72) >>> 6) << 6);
+    padded.set(bytes);
+    padded[length] = 0x80;
+    const tail = new DataView(padded.buffer, padded.length - 8);
+    tail.setUint32(0, Math.floor(length / 0x20000000));
+    tail.setUint32(4, length << 3);
+
+    const view = new DataView(padded.buffer);
+    const w = new Uint32Array(64);
+    const rotr = (x, n) => (x >>> n) | (x << (32 - n));
+    for (let block = 0; block < padded.length; block += 64) {
+      for (let i = 0; i < 16; i++) w[i] = view.getUint32(block + 4 * i);
+      for (let i = 16; i < 64; i++) {
+        const s0 = rotr(w[i - 15], 7) ^ rotr(w[i - 15], 18) ^ (w[i - 15] >>> 3);
+        const s1 = rotr(w[i - 2], 17) ^ rotr(w[i - 2], 19) ^ (w[i - 2] >>> 10);
+        w[i] = w[i - 16] + s0 + w[i - 7] + s1;
+      }
+      let [a, b, c, d, e, f, g, hh] = h;
+      for (let i = 0; i < 64; i++) {
+        const t1 = hh + (rotr(e, 6) ^ rotr(e, 11) ^ rotr(e, 25)) + ((e & f) ^ (~e & g)) + k[i] + w[i];
+        const t2 = (rotr(a, 2) ^ rotr(a, 13) ^ rotr(a, 22)) + ((a & b) ^ (a & c) ^ (b & c));
+        hh = g; g = f; f = e; e = (d + t1) >>> 0;
+        d = c; c = b; b = a; a = (t1 + t2) >>> 0;
+      }
+      h[0] += a; h[1] += b; h[2] += c; h[3] += d;
+      h[4] += e; h[5] += f; h[6] += g; h[7] += hh;
+    }
+    return Array.from(h, (x) => x.toString(16).padStart(8, '0')).join('');
+  }
+
   /**
    * ტვირთავს default dictionary-ს (Browser + Node.js compatible)
    *
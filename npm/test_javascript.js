@@ -119,4 +119,52 @@ console.log('ESM/CJS parity:');
   });
 }
 
+console.log('Compact dictionary (data/exceptions.ghd):');
+
+{
+  const { readFileSync } = await import('node:fs');
+  const { createHash } = await import('node:crypto');
+  const artifact = readFileSync(new URL('./data/exceptions.ghd', import.meta.url));
+  const json = JSON.parse(readFileSync(new URL('./data/exceptions.json', import.meta.url), 'utf8'));
+
+  test('compact: same entries and clusters as the JSON dictionary', () => {
+    const h = new GeorgianHyphenatorESM('-');
+    h.loadCompactLibrary(artifact);
+    assert.deepEqual(h.exportDictionary(), json);
+    assert.deepEqual(h.getHarmonicClusters().sort(),
+      new GeorgianHyphenatorESM().getHarmonicClusters().sort());
+  });
+
+  test('compact: fingerprint matches the payload', () => {
+    const h = new GeorgianHyphenatorCJS('-');
+    const fingerprint = h.loadCompactLibrary(artifact.toString('base64'));
+    const digest = createHash('sha256').update(artifact.subarray(28)).digest('hex');
+    assert.equal(fingerprint, digest.slice(0, 16));
+    assert.equal(h.dataFingerprint, fingerprint);
+    assert.equal(h.hyphenate('კომპიუტერი'), 'კომ-პიუ-ტე-რი');
+  });
+
+  test('compact: rejects other data', () => {
+    const h = new GeorgianHyphenatorESM('-');
+    assert.throws(() => h.loadCompactLibrary(new Uint8Array(40)), /compact/);
+  });
+
+  test('compact: rejects a payload that does not match its fingerprint', () => {
+    const h = new GeorgianHyphenatorCJS('-');
+    const corrupt = Uint8Array.from(artifact);
+    corrupt[corrupt.length - 1] ^= 1;
+    assert.throws(() => h.loadCompactLibrary(corrupt), /fingerprint mismatch/);
+    assert.equal(h.dataFingerprint, null);
+    assert.equal(h.dictionary.size, 0);
+  });
+
+  test('compact: SHA-256 matches node:crypto', () => {
+    const h = new GeorgianHyphenatorESM();
+    for (const size of [0, 1, 55, 56, 63, 64, 65, 1000]) {
+      const data = new Uint8Array(size).map((_, i) => (i * 31 + size) & 0xFF);
+      assert.equal(h._sha256Hex(data), createHash('sha256').update(data).digest('hex'));
+    }
+  });
+}
+
 console.log(`\nAll ${passed} tests passed`);
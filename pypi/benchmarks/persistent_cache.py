@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+hyphenate_text() throughput with and without a PersistentCache
+
+Builds a text from a random Georgian vocabulary with a skewed word
+frequency, checks that cached and uncached results agree, then times one
+hyphenate_text() call over the whole text with no cache, a cold cache, a
+warm cache (entries on disk, none in memory) and a preloaded cache.
+
+    python benchmarks/persistent_cache.py --words 60000
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from georgian_hyphenation import GeorgianHyphenator, PersistentCache  # noqa: E402
+
+LETTERS = 'აბგდევზთიკლმნოპჟრსტუფქღყშჩცძწჭხჯ'
+
+
+def random_text(count, vocabulary_size, seed=7):
+    rng = random.Random(seed)
+    vocabulary = [''.join(rng.choice(LETTERS) for _ in range(rng.randint(4, 12)))
+                  for _ in range(vocabulary_size)]
+    # Zipf-like: a few words make up most of the text
+    weights = [1 / (rank + 1) for rank in range(vocabulary_size)]
+    return ' '.join(rng.choices(vocabulary, weights, k=count))
+
+
+def hyphenator(cache=None, preload=0):
+    h = GeorgianHyphenator('-')
+    h.load_default_library()
+    if cache is not None:
+        h.set_cache(cache, preload=preload)
+    return h
+
+
+def timed(h, text):
+    start = time.perf_counter()
+    h.hyphenate_text(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--words', type=int, default=60000)
+    parser.add_argument('--vocabulary', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    text = random_text(args.words, args.vocabulary)
+    expected = hyphenator().hyphenate_text(text)
+
+    results = {name: float('inf') for name in ('no cache', 'cold', 'warm', 'preload')}
+    for _ in range(args.repeat):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cache.sqlite3')
+            results['no cache'] = min(results['no cache'], timed(hyphenator(), text))
+            with PersistentCache(path) as cache:
+                results['cold'] = min(results['cold'], timed(hyphenator(cache), text))
+            with PersistentCache(path) as cache:
+                results['warm'] = min(results['warm'], timed(hyphenator(cache), text))
+            with PersistentCache(path) as cache:
+                h = hyphenator(cache, preload=args.vocabulary)
+                assert h.hyphenate_text(text) == expected
+                results['preload'] = min(results['preload'], timed(h, text))
+
+    baseline = results['no cache']
+    for name, seconds in results.items():
+        print(f'{name:>8}: {seconds:.3f}s ({baseline / seconds:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
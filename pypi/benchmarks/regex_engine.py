@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+hyphenate_text() throughput: default Python engine vs. regex engine
+
+Generates random Georgian-shaped words (vowel runs, consonant clusters,
+doubled consonants), checks that both engines agree on every word for a
+few left/right minimums, then times one hyphenate_text() call over the
+whole text with the default dictionary loaded.
+
+    python benchmarks/regex_engine.py --words 50000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from georgian_hyphenation import GeorgianHyphenator  # noqa: E402
+
+CONSONANTS = 'ბგდვზთკლმნპჟრსტფქღყშჩცძწჭხჯჰ'
+VOWELS = 'აეიოუ'
+
+
+def random_words(count, seed=5):
+    rng = random.Random(seed)
+    words = []
+    for _ in range(count):
+        word = ''
+        for _ in range(rng.randint(1, 6)):
+            run = ''.join(rng.choice(CONSONANTS)
+                          for _ in range(rng.choice([0, 0, 1, 1, 1, 2, 2, 3, 4])))
+            if run and rng.random() < 0.2:
+                run += run[-1]
+            word += run + ''.join(rng.choice(VOWELS) for _ in range(rng.choice([1, 1, 1, 2])))
+        if rng.random() < 0.5:
+            word += rng.choice(CONSONANTS)
+        words.append(word)
+    return words
+
+
+def hyphenator(engine, left_min=2, right_min=2):
+    h = GeorgianHyphenator('-').set_left_min(left_min).set_right_min(right_min)
+    h.load_default_library()
+    return h.set_engine(engine)
+
+
+def timed(h, text, repeat):
+    h.hyphenate_text(text[:100])  # compile outside the measurement
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        h.hyphenate_text(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--words', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    words = random_words(args.words)
+    for left_min, right_min in ((2, 2), (1, 1), (3, 2), (1, 3), (4, 4)):
+        default = hyphenator('default', left_min, right_min)
+        regex = hyphenator('regex', left_min, right_min)
+        mismatches = sum(default.hyphenate_text(w) != regex.hyphenate_text(w) for w in words)
+        print(f'left_min={left_min} right_min={right_min}: {mismatches} mismatches')
+
+    text = ' '.join(words)
+    default_time = timed(hyphenator('default'), text, args.repeat)
+    regex_time = timed(hyphenator('regex'), text, args.repeat)
+    print(f'{args.words} words: default {default_time:.3f}s, regex {regex_time:.3f}s '
+          f'({default_time / regex_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Per-worker memory: private dictionary copies vs. SharedTables
+
+Builds a synthetic house dictionary, then starts worker processes that
+either load it privately (load_library) or attach to one SharedTables
+block, hyphenate every dictionary word, and report their memory. USS
+(private memory) is the number that multiplies with the worker count.
+
+    python benchmarks/shared_tables_rss.py --words 300000 --workers 4
+
+Linux only (reads /proc/self/smaps_rollup).
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from georgian_hyphenation import GeorgianHyphenator, SharedTables  # noqa: E402
+
+CONSONANTS = 'ბგდვზთკლმნპჟრსტფქღყშჩცძწჭხჯჰ'
+VOWELS = 'აეიოუ'
+
+
+def memory_kb():
+    """Return (rss, pss, uss) of this process in kB"""
+    values = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                values[parts[0].rstrip(':')] = int(parts[1])
+    uss = values.get('Private_Clean', 0) + values.get('Private_Dirty', 0)
+    return values.get('Rss', 0), values.get('Pss', 0), uss
+
+
+def synthetic_dictionary(count, seed=1):
+    rng = random.Random(seed)
+    h = GeorgianHyphenator('-')
+    data = {}
+    while len(data) < count:
+        word = ''.join(rng.choice(CONSONANTS) * rng.randint(0, 1) + rng.choice(CONSONANTS)
+                       + rng.choice(VOWELS) for _ in range(rng.randint(2, 6)))
+        data[word] = h.apply_algorithm(word)
+    return data
+
+
+def worker(mode, source, words_path, queue):
+    with open(words_path, encoding='utf-8') as f:
+        words = json.load(f)
+    before = memory_kb()
+    if mode == 'private':
+        with open(source, encoding='utf-8') as f:
+            h = GeorgianHyphenator('-')
+            h.load_library(json.load(f))
+    else:
+        tables = SharedTables.attach(source)
+        h = GeorgianHyphenator('-').use_shared_tables(tables)
+    start = time.perf_counter()
+    for word in words:
+        h.hyphenate(word)
+    elapsed = time.perf_counter() - start
+    after = memory_kb()
+    queue.put((after[0] - before[0], after[1] - before[1], after[2] - before[2],
+               len(words) / elapsed))
+
+
+def run(mode, source, words_path, workers):
+    queue = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=worker, args=(mode, source, words_path, queue))
+             for _ in range(workers)]
+    for p in procs:
+        p.start()
+    results = [queue.get() for _ in procs]
+    for p in procs:
+        p.join()
+    n = len(results)
+    return tuple(sum(r[i] for r in results) / n for i in range(4))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--words', type=int, default=300000)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    data = synthetic_dictionary(args.words)
+    with tempfile.TemporaryDirectory() as tmp:
+        dict_path = os.path.join(tmp, 'dictionary.json')
+        words_path = os.path.join(tmp, 'words.json')
+        with open(dict_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        with open(words_path, 'w', encoding='utf-8') as f:
+            json.dump(list(data), f, ensure_ascii=False)
+
+        h = GeorgianHyphenator('-')
+        h.load_library(data)
+        tables = SharedTables.create(h)
+        try:
+            print(f'{args.words} entries, {args.workers} workers, '
+                  f'shared block {len(tables._buf) / 1024:.0f} kB')
+            print(f"{'mode':<8} {'dRSS kB':>10} {'dPSS kB':>10} {'dUSS kB':>10} {'words/s':>10}")
+            for mode, source in (('private', dict_path), ('shared', tables.name)):
+                rss, pss, uss, rate = run(mode, source, words_path, args.workers)
+                print(f'{mode:<8} {rss:>10.0f} {pss:>10.0f} {uss:>10.0f} {rate:>10.0f}')
+        finally:
+            tables.close()
+            tables.unlink()
+
+
+if __name__ == '__main__':
+    main()
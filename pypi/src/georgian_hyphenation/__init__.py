@@ -12,6 +12,11 @@ from .hyphenator import (
     to_tex_pattern,
     to_hunspell_format
 )
+from .cache import PersistentCache
+from .stats import CorpusStatistics
+from .shared import SharedTables
+from .workload import WorkloadRecorder
+from .fragments import FragmentCache
 
 __version__ = '2.3.0'
 __author__ = 'Guram Zhgamadze'
@@ -21,5 +26,10 @@ __all__ = [
     'get_syllables',
     'hyphenate_text',
     'to_tex_pattern',
-    'to_hunspell_format'
+    'to_hunspell_format',
+    'PersistentCache',
+    'CorpusStatistics',
+    'SharedTables',
+    'WorkloadRecorder',
+    'FragmentCache'
 ]
\ No newline at end of file
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""
+Persistent result cache
+დამარცვლის შედეგების მუდმივი ქეში
+
+Stores word -> break positions in an SQLite file so restarted workers do
+not start cold. Every entry is keyed by the hyphenator's configuration
+fingerprint (hyphen_char, left/right min, clusters, dictionary), so a
+changed configuration never sees stale results.
+
+Usage:
+    cache = PersistentCache('hyphenation-cache.sqlite3', max_entries=200000)
+    h = GeorgianHyphenator().set_cache(cache, preload=20000)
+    ...
+    cache.close()
+"""
+
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+
+
+class PersistentCache:
+    """
+    SQLite-backed word -> break positions cache with warm start
+
+    Features:
+    - Entries keyed by configuration fingerprint
+    - In-memory front layer: hits are served from memory without any
+      per-hit bookkeeping; the file is only read for words not in memory
+    - Batched write-back of new entries; word frequencies are sampled
+      (one hit in ``sample_every`` is counted, weighted accordingly)
+    - Size cap with indexed eviction (stale fingerprints first, then least
+      used), down to 90% of the cap so it does not run on every flush
+    - Preload of the most frequent words at startup
+    - Safe to share between threads
+    """
+
+    def __init__(self, path: str, max_entries: int = 100000,
+                 batch_size: int = 4096, memory_size: int = 100000,
+                 sample_every: int = 64):
+        """
+        Open (or create) a cache file
+
+        Args:
+            path: SQLite database file (':memory:' for a throwaway cache)
+            max_entries: Maximum number of rows kept on disk
+            batch_size: Number of buffered new entries (or sampled hit
+                        counts) that triggers a write-back
+            memory_size: Maximum number of words kept in memory
+            sample_every: Count one in this many hits toward word frequency
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.batch_size = batch_size
+        self.memory_size = memory_size
+        self.sample_every = max(1, sample_every)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            ' fingerprint TEXT NOT NULL,'
+            ' word TEXT NOT NULL,'
+            ' breaks TEXT NOT NULL,'
+            ' hits INTEGER NOT NULL DEFAULT 0,'
+            ' PRIMARY KEY (fingerprint, word))')
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS entries_hits'
+            ' ON entries (fingerprint, hits)')
+        self._conn.commit()
+        self._rows = self.size()
+
+        self._fingerprint: Optional[str] = None
+        self._memory: Dict[str, Tuple[int, ...]] = {}
+        # True while every row of the bound configuration is in memory, so
+        # a memory miss is a miss without asking the file
+        self._complete = False
+        self._pending: Dict[str, Tuple[int, ...]] = {}
+        self._hits: Dict[str, int] = {}
+        self._countdown = self.sample_every
+
+        self.hits = 0
+        self.misses = 0
+
+    def _bind(self, fingerprint: str) -> None:
+        """Switch to another configuration, writing back the old one first"""
+        with self._lock:
+            if fingerprint == self._fingerprint:
+                return
+            self.flush()
+            self._fingerprint = fingerprint
+            self._memory.clear()
+            rows = self._conn.execute(
+                'SELECT COUNT(*) FROM entries WHERE fingerprint = ?',
+                (fingerprint,)).fetchone()[0]
+            self._complete = rows == 0
+
+    def get(self, fingerprint: str, word: str) -> Optional[Tuple[int, ...]]:
+        """
+        Look up the break positions of a word
+
+        Args:
+            fingerprint: Configuration fingerprint of the caller
+            word: Sanitized word
+
+        Returns:
+            Tuple of break offsets, or None on a miss
+        """
+        if fingerprint != self._fingerprint:
+            self._bind(fingerprint)
+
+        breaks = self._memory.get(word)
+        if breaks is not None:
+            self.hits += 1
+            self._countdown -= 1
+            if self._countdown <= 0:
+                self._sample(word)
+            return breaks
+
+        if self._complete:
+            self.misses += 1
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT breaks FROM entries WHERE fingerprint = ? AND word = ?',
+                (fingerprint, word)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        breaks = _decode(row[0])
+        self._remember(word, breaks)
+        self.hits += 1
+        return breaks
+
+    def put(self, fingerprint: str, word: str, breaks: List[int]) -> None:
+        """
+        Store the break positions of a word (written back in batches)
+
+        Args:
+            fingerprint: Configuration fingerprint of the caller
+            word: Sanitized word
+            breaks: Ascending break offsets
+        """
+        if fingerprint != self._fingerprint:
+            self._bind(fingerprint)
+        breaks = tuple(breaks)
+        with self._lock:
+            self._pending[word] = breaks
+            self._remember(word, breaks)
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    def preload(self, fingerprint: str, top_n: int) -> int:
+        """
+        Load the most frequently used words of a configuration into memory
+
+        Args:
+            fingerprint: Configuration fingerprint
+            top_n: Number of words to load
+
+        Returns:
+            Number of words loaded
+        """
+        self._bind(fingerprint)
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT word, breaks FROM entries WHERE fingerprint = ?'
+                ' ORDER BY hits DESC LIMIT ?',
+                (fingerprint, min(top_n, self.memory_size) + 1)).fetchall()
+            for word, breaks in rows[:self.memory_size]:
+                self._memory[word] = _decode(breaks)
+            if len(rows) <= min(top_n, self.memory_size):
+                # Everything on disk is now in memory
+                self._complete = True
+        return min(len(rows), self.memory_size, top_n)
+
+    def flush(self) -> None:
+        """Write buffered entries and hit counts back and enforce the size cap"""
+        with self._lock:
+            if self._fingerprint is None or not (self._pending or self._hits):
+                return
+
+            fingerprint = self._fingerprint
+            with self._conn:
+                if self._pending:
+                    cursor = self._conn.executemany(
+                        'INSERT OR IGNORE INTO entries (fingerprint, word, breaks)'
+                        ' VALUES (?, ?, ?)',
+                        [(fingerprint, word, _encode(breaks))
+                         for word, breaks in self._pending.items()])
+                    self._rows += max(cursor.rowcount, 0)
+                if self._hits:
+                    self._conn.executemany(
+                        'UPDATE entries SET hits = hits + ?'
+                        ' WHERE fingerprint = ? AND word = ?',
+                        [(count, fingerprint, word) for word, count in self._hits.items()])
+                if self._rows > self.max_entries:
+                    self._evict()
+
+            self._pending.clear()
+            self._hits.clear()
+
+    def _evict(self) -> None:
+        """Drop rows down to 90% of max_entries: stale fingerprints first, then least used"""
+        # Other processes may share the file; count exactly before deleting
+        self._rows = self.size()
+        excess = self._rows - self.max_entries * 9 // 10
+        if excess <= 0:
+            return
+        # Both deletes walk the (fingerprint, hits) index and stop after
+        # `excess` rows; nothing is sorted
+        deleted = self._conn.execute(
+            'DELETE FROM entries WHERE rowid IN ('
+            ' SELECT rowid FROM entries WHERE fingerprint < ? OR fingerprint > ?'
+            ' LIMIT ?)',
+            (self._fingerprint, self._fingerprint, excess)).rowcount
+        if deleted < excess:
+            deleted += self._conn.execute(
+                'DELETE FROM entries WHERE rowid IN ('
+                ' SELECT rowid FROM entries INDEXED BY entries_hits'
+                ' WHERE fingerprint = ? ORDER BY hits LIMIT ?)',
+                (self._fingerprint, excess - deleted)).rowcount
+        self._rows -= deleted
+
+    def size(self) -> int:
+        """
+        Get the number of rows on disk
+
+        Returns:
+            Number of cached (fingerprint, word) entries
+        """
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove every entry, for all configurations"""
+        with self._lock:
+            self._memory.clear()
+            self._pending.clear()
+            self._hits.clear()
+            with self._conn:
+                self._conn.execute('DELETE FROM entries')
+            self._rows = 0
+            self._complete = True
+
+    def close(self) -> None:
+        """Flush and close the database"""
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+    def __enter__(self) -> 'PersistentCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _remember(self, word: str, breaks: Tuple[int, ...]) -> None:
+        if len(self._memory) < self.memory_size:
+            self._memory[word] = breaks
+        else:
+            # The word lives only on disk from now on
+            self._complete = False
+
+    def _sample(self, word: str) -> None:
+        """Count a sampled hit, weighted by the sampling interval"""
+        with self._lock:
+            self._countdown = self.sample_every
+            self._hits[word] = self._hits.get(word, 0) + self.sample_every
+            if len(self._hits) >= self.batch_size:
+                self.flush()
+
+
+def _encode(breaks: Tuple[int, ...]) -> str:
+    return ','.join(map(str, breaks))
+
+
+def _decode(value: str) -> Tuple[int, ...]:
+    return tuple(int(pos) for pos in value.split(',')) if value else ()
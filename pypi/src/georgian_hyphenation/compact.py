@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""
+Compact dictionary artifact for the JavaScript runtimes
+კომპაქტური ლექსიკონი ბრაუზერისთვის
+
+Exports a hyphenator's dictionary and harmonic clusters as a small binary
+artifact that the npm package (``loadCompactLibrary()``) and the browser
+extensions load without JSON parsing. Keys are stored once, sorted and
+front-coded, one byte per Georgian letter; each entry's breaks are a
+bitmask. The header carries a fingerprint of the payload, so every runtime
+can confirm it uses identical data.
+
+Layout (little-endian):
+    header   'GHCD', version u8, reserved u8, cluster count u16,
+             entry count u32, fingerprint (16 ASCII hex characters)
+    clusters 2 letter bytes each
+    entries  shared-prefix length u8, suffix length u8, suffix letters,
+             varint: (break bitmask << 1), bit i = break before letter i;
+             or 1 followed by an explicit value (length u8, letters, '-' = 0)
+             for entries whose value does not spell the key
+
+Letter bytes: U+10D0 + (byte - 1).
+
+Usage:
+    python -m georgian_hyphenation.compact --default -o ../npm/data/exceptions.ghd
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from .hyphenator import GeorgianHyphenator, _parse_exception
+
+MAGIC = b'GHCD'
+VERSION = 1
+_HEADER = struct.Struct('<4sBBHI16s')
+_FIRST_LETTER = 0x10D0
+_LAST_LETTER = 0x10FF
+
+# Letter byte -> character (str.translate over latin-1 decoded bytes)
+_TEXT_TABLE = {byte: chr(_FIRST_LETTER + byte - 1) for byte in range(1, 49)}
+_TEXT_TABLE[0] = '-'
+
+
+def export_compact(hyphenator: GeorgianHyphenator) -> bytes:
+    """
+    Serialize a hyphenator's dictionary and clusters
+
+    Args:
+        hyphenator: GeorgianHyphenator whose data to export
+
+    Returns:
+        Artifact bytes
+
+    Raises:
+        ValueError: If a key or cluster contains non-Georgian characters,
+                    or a word is longer than 255 letters
+    """
+    clusters = sorted(hyphenator.harmonic_clusters)
+    payload = bytearray()
+    for cluster in clusters:
+        if len(cluster) != 2:
+            raise ValueError('cluster %r must have two letters' % cluster)
+        payload += _letters(cluster)
+
+    previous = b''
+    for word, hyphenated in sorted(hyphenator.dictionary.items()):
+        key = _letters(word)
+        if len(key) > 255:
+            raise ValueError('word %r is longer than 255 letters' % word)
+        shared = 0
+        limit = min(len(key), len(previous))
+        while shared < limit and key[shared] == previous[shared]:
+            shared += 1
+        payload += bytes((shared, len(key) - shared)) + key[shared:]
+        previous = key
+
+        breaks = _parse_exception(word, hyphenated)
+        if breaks is None:
+            value = _letters(hyphenated, hyphen=True)
+            if len(value) > 255:
+                raise ValueError('value %r is longer than 255 characters' % hyphenated)
+            payload += b'\x01' + bytes((len(value),)) + value
+        else:
+            payload += _varint(sum(1 << pos for pos in breaks) << 1)
+
+    header = _HEADER.pack(MAGIC, VERSION, 0, len(clusters), len(hyphenator.dictionary),
+                          _fingerprint(payload).encode('ascii'))
+    return header + bytes(payload)
+
+
+def read_compact(data: bytes) -> Tuple[Dict[str, str], Set[str], str]:
+    """
+    Decode an artifact written by export_compact()
+
+    Args:
+        data: Artifact bytes
+
+    Returns:
+        (dictionary, harmonic clusters, fingerprint)
+
+    Raises:
+        ValueError: If the data is not an artifact or fails its fingerprint
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError('not a compact hyphenation dictionary')
+    magic, version, _, cluster_count, entry_count, fingerprint = _HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('not a compact hyphenation dictionary (or wrong version)')
+    fingerprint = fingerprint.decode('ascii')
+    if _fingerprint(data[_HEADER.size:]) != fingerprint:
+        raise ValueError('compact dictionary is corrupt (fingerprint mismatch)')
+
+    pos = _HEADER.size
+    clusters = set()
+    for _ in range(cluster_count):
+        clusters.add(_text(data[pos:pos + 2]))
+        pos += 2
+
+    dictionary: Dict[str, str] = {}
+    word = ''
+    for _ in range(entry_count):
+        shared, length = data[pos], data[pos + 1]
+        pos += 2
+        word = word[:shared] + _text(data[pos:pos + length])
+        pos += length
+        if data[pos] == 1:
+            length = data[pos + 1]
+            dictionary[word] = _text(data[pos + 2:pos + 2 + length])
+            pos += 2 + length
+            continue
+        value, pos = _read_varint(data, pos)
+        mask = value >> 1
+        pieces = []
+        start = 0
+        while mask:
+            low = mask & -mask
+            end = low.bit_length() - 1
+            pieces.append(word[start:end])
+            start = end
+            mask ^= low
+        pieces.append(word[start:])
+        dictionary[word] = '-'.join(pieces)
+    return dictionary, clusters, fingerprint
+
+
+def compact_fingerprint(hyphenator: GeorgianHyphenator) -> str:
+    """
+    Get the fingerprint an artifact of this hyphenator's data would carry
+
+    Compare it with ``dataFingerprint`` in JavaScript after
+    loadCompactLibrary() to confirm both runtimes use identical data.
+
+    Args:
+        hyphenator: GeorgianHyphenator whose data to fingerprint
+
+    Returns:
+        16-character hex digest
+    """
+    return _HEADER.unpack_from(export_compact(hyphenator))[5].decode('ascii')
+
+
+def build_report(artifact: bytes, json_text: str, rounds: int = 200) -> Dict[str, object]:
+    """
+    Compare an artifact with the equivalent JSON dictionary
+
+    Args:
+        artifact: Output of export_compact()
+        json_text: The same dictionary as JSON text
+        rounds: Decode repetitions for the timings
+
+    Returns:
+        Raw and gzip sizes in bytes for both, and mean decode times in
+        microseconds (json.loads vs. read_compact)
+    """
+    json_bytes = json_text.encode('utf-8')
+
+    def timed(decode, payload):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            decode(payload)
+        return (time.perf_counter() - start) / rounds * 1e6
+
+    return {
+        'json_bytes': len(json_bytes),
+        'json_gzip_bytes': len(gzip.compress(json_bytes, mtime=0)),
+        'compact_bytes': len(artifact),
+        'compact_gzip_bytes': len(gzip.compress(artifact, mtime=0)),
+        'json_decode_us': timed(json.loads, json_text),
+        'compact_decode_us': timed(read_compact, artifact),
+    }
+
+
+def _letters(text: str, hyphen: bool = False) -> bytes:
+    out = bytearray()
+    for ch in text:
+        code = ord(ch)
+        if hyphen and ch == '-':
+            out.append(0)
+        elif _FIRST_LETTER <= code <= _LAST_LETTER:
+            out.append(code - _FIRST_LETTER + 1)
+        else:
+            raise ValueError('%r contains a non-Georgian character %r' % (text, ch))
+    return bytes(out)
+
+
+def _text(data: bytes) -> str:
+    return data.decode('latin-1').translate(_TEXT_TABLE)
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _fingerprint(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(
+        prog='python -m georgian_hyphenation.compact',
+        description='Export a dictionary as a compact artifact for the JavaScript runtimes.')
+    parser.add_argument('input', nargs='?',
+                        help='dictionary JSON file (word -> "hy-phe-na-ted")')
+    parser.add_argument('--default', action='store_true',
+                        help='export the bundled exceptions dictionary')
+    parser.add_argument('-o', '--output', required=True, help='artifact file to write')
+    parser.add_argument('--add-cluster', action='append', default=[],
+                        metavar='CLUSTER',
+                        help='extra harmonic cluster (repeatable)')
+    args = parser.parse_args(argv)
+
+    if not args.input and not args.default:
+        parser.error('give a dictionary file or --default')
+
+    path = args.input
+    if args.default:
+        path = os.path.join(os.path.dirname(__file__), 'data', 'exceptions.json')
+    with open(path, 'r', encoding='utf-8') as f:
+        json_text = f.read()
+
+    h = GeorgianHyphenator('-')
+    for cluster in args.add_cluster:
+        h.add_harmonic_cluster(cluster)
+    h.load_library(json.loads(json_text))
+
+    artifact = export_compact(h)
+    with open(args.output, 'wb') as f:
+        f.write(artifact)
+
+    report = build_report(artifact, json_text)
+    print(f'{args.output}: {h.get_dictionary_size()} entries, '
+          f'{len(h.harmonic_clusters)} clusters, fingerprint {compact_fingerprint(h)}')
+    print(f"  size    JSON {report['json_bytes']:>7,} B  (gzip {report['json_gzip_bytes']:,} B)"
+          f"   compact {report['compact_bytes']:>7,} B  (gzip {report['compact_gzip_bytes']:,} B)")
+    print(f"  decode  JSON {report['json_decode_us']:>7.1f} us"
+          f"                  compact {report['compact_decode_us']:>7.1f} us  (Python)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+"""
+Zip-container document pipeline (DOCX / ODT / EPUB)
+დოკუმენტების დამარცვლა
+
+Streams the members of a DOCX, ODT or EPUB file, rewrites only the text
+nodes of the XML parts that carry prose and copies every other member
+through byte-for-byte, without recompressing it. XML parts are processed
+in fixed-size chunks, so memory use does not depend on document size.
+
+- DOCX: text of ``w:t`` runs in the body, headers, footers, notes and
+  comments. Each paragraph's runs are hyphenated as one text (Word splits
+  words across runs), so a paragraph is held in memory until it closes.
+  Breaks are written as ``<w:softHyphen/>`` elements, the same markup the
+  Word add-in produces.
+- ODT: text inside ``text:p`` / ``text:h`` of content.xml and styles.xml
+  (U+00AD, ODF's soft hyphen).
+- EPUB: XHTML text inside ``<body>``, skipping the same tags as
+  hyphenate_html() (U+00AD, or the hyphenator's hyphen_char).
+
+Usage:
+    h = GeorgianHyphenator()
+    h.load_default_library()
+    h.hyphenate_document('book.epub', 'book.hyphenated.epub', workers=4)
+"""
+
+import codecs
+import copy
+import os
+import re
+import shutil
+import struct
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, List, Optional
+
+from .hyphenator import _SKIP_TAGS
+
+CHUNK_SIZE = 1 << 16
+
+# One markup token: comment, CDATA, processing instruction, DOCTYPE or tag
+# (attribute values may legally contain '>')
+_MARKUP = re.compile(
+    r'<!--.*?-->'
+    r'|<!\[CDATA\[.*?\]\]>'
+    r'|<\?.*?\?>'
+    r'|<!DOCTYPE(?:[^>\[]|\[[^\]]*\])*>'
+    r'|<(?:[^>"\']|"[^"]*"|\'[^\']*\')*>',
+    re.DOTALL | re.IGNORECASE)
+_TAG_NAME = re.compile(r'</?([^\s/>]+)')
+
+# Tokens whose body may contain '>': until the terminator has been read,
+# the generic tag alternative would end them too early
+_DELIMITED = (('<!--', '-->'), ('<![CDATA[', ']]>'), ('<?', '?>'))
+
+# Characters that may belong to a word still being read
+_WORD_TAIL = re.compile('[ა-ჰ\u00AD\u200B]+$')
+
+# DOCX markup inside a paragraph that does not end a word (run boundaries,
+# spelling/grammar marks, bookmarks, revisions); everything else does
+_DOCX_TRANSPARENT = {
+    'w:r', 'w:t', 'w:proofErr', 'w:bookmarkStart', 'w:bookmarkEnd', 'w:ins',
+    'w:hyperlink', 'w:smartTag', 'w:customXml', 'w:permStart', 'w:permEnd',
+    'w:lastRenderedPageBreak',
+}
+
+_DOCX_PARTS = re.compile(
+    r'^word/(document|header\d*|footer\d*|footnotes|endnotes|comments)\.xml$')
+_EPUB_PARTS = re.compile(r'\.(xhtml|html|htm)$', re.IGNORECASE)
+
+# Document kind -> (enabling elements, skipped elements, compare local names)
+_PROFILES = {
+    'docx': ({'w:t'}, set(), False),
+    'odt': ({'text:p', 'text:h'}, set(), False),
+    'epub': ({'body'}, set(_SKIP_TAGS), True),
+}
+
+
+def detect_document_kind(zin: zipfile.ZipFile) -> str:
+    """
+    Identify the kind of a zip-container document
+
+    Args:
+        zin: Open ZipFile
+
+    Returns:
+        'docx', 'odt' or 'epub'
+
+    Raises:
+        ValueError: If the container is none of these
+    """
+    names = set(zin.namelist())
+    if 'mimetype' in names:
+        mimetype = zin.read('mimetype').decode('ascii', 'replace').strip()
+        if mimetype == 'application/epub+zip':
+            return 'epub'
+        if mimetype == 'application/vnd.oasis.opendocument.text':
+            return 'odt'
+    if '[Content_Types].xml' in names and 'word/document.xml' in names:
+        return 'docx'
+    raise ValueError('not a DOCX, ODT or EPUB document')
+
+
+def _is_target(kind: str, name: str) -> bool:
+    if kind == 'docx':
+        return bool(_DOCX_PARTS.match(name))
+    if kind == 'odt':
+        return name in ('content.xml', 'styles.xml')
+    return bool(_EPUB_PARTS.search(name))
+
+
+def rewrite_xml(hyphenator, kind: str, src: BinaryIO, dst: BinaryIO,
+                chunk_size: int = CHUNK_SIZE) -> None:
+    """
+    Hyphenate the prose text nodes of one UTF-8 XML stream
+
+    Markup, comments, CDATA and text outside the prose elements are
+    written back unchanged. In DOCX, the ``w:t`` texts of a paragraph are
+    hyphenated as one text, because Word splits words across runs
+    (spelling marks, revision ids); each paragraph is held in memory until
+    it closes.
+
+    Args:
+        hyphenator: GeorgianHyphenator providing rules and dictionary
+        kind: 'docx', 'odt' or 'epub'
+        src: Binary stream to read
+        dst: Binary stream to write
+        chunk_size: Bytes per read
+    """
+    enable, skip, local_names = _PROFILES[kind]
+    if kind in ('docx', 'odt'):
+        # ODF's soft hyphen is U+00AD; Word needs <w:softHyphen/> elements,
+        # so DOCX breaks are marked with U+00AD and converted on output.
+        # Any other hyphen_char would show up as visible text.
+        hyphenator = copy.copy(hyphenator)
+        hyphenator._cache = None
+        hyphenator._recorder = None
+        hyphenator.set_hyphen_char('\u00AD')
+    soft_break = None
+    hyphen_char = hyphenator.hyphen_char
+
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    enabled = 0
+    skipped = 0
+    buffer = ''
+    eof = False
+
+    # DOCX paragraph being collected: output pieces, and per w:t text its
+    # index in `paragraph` (None marks content that separates words)
+    paragraph: Optional[List[str]] = None
+    segments: List[Optional[int]] = []
+    paragraph_depth = 0
+    properties = 0
+
+    while True:
+        raw = src.read(chunk_size)
+        if not raw:
+            eof = True
+        buffer += decoder.decode(raw, final=eof)
+
+        out = []
+        pos = 0
+        while pos < len(buffer):
+            sink = out if paragraph is None else paragraph
+            lt = buffer.find('<', pos)
+            if lt == -1:
+                # Text runs to the end of the buffer: keep back a word
+                # that may continue in the next chunk
+                end = len(buffer)
+                if not eof:
+                    tail = _WORD_TAIL.search(buffer, pos)
+                    if tail:
+                        end = tail.start()
+                text = buffer[pos:end]
+                pos = end
+            else:
+                text = buffer[pos:lt]
+                pos = lt
+
+            if text:
+                if enabled and not skipped:
+                    if paragraph is not None:
+                        segments.append(len(paragraph))
+                    else:
+                        text = hyphenator.hyphenate_text(text)
+                        if soft_break and hyphen_char in text:
+                            text = text.replace(hyphen_char, soft_break)
+                sink.append(text)
+
+            if lt == -1:
+                break
+
+            if not eof and _incomplete(buffer, pos):
+                break  # wait for the terminator
+            match = _MARKUP.match(buffer, pos)
+            if not match:
+                if eof:
+                    sink.append(buffer[pos:])
+                    pos = len(buffer)
+                break  # incomplete markup: wait for more data
+
+            token = match.group(0)
+            pos = match.end()
+            sink.append(token)
+            if token.startswith(('<!', '<?')):
+                continue
+
+            name = _TAG_NAME.match(token).group(1)
+            if local_names:
+                name = name.rsplit(':', 1)[-1].lower()
+            closing = token.startswith('</')
+
+            if kind == 'docx':
+                if name == 'w:p' and not token.endswith('/>'):
+                    if not closing:
+                        paragraph_depth += 1
+                        if paragraph is None:
+                            paragraph, segments = [], []
+                            continue
+                    else:
+                        paragraph_depth = max(0, paragraph_depth - 1)
+                        if paragraph_depth == 0 and paragraph is not None:
+                            out.extend(_hyphenate_paragraph(
+                                hyphenator, paragraph, segments, soft_break))
+                            paragraph = None
+                            continue
+                    segments.append(None)  # nested paragraph (text box)
+                elif name in ('w:rPr', 'w:pPr'):
+                    if not token.endswith('/>'):
+                        properties = max(0, properties + (-1 if closing else 1))
+                elif (paragraph is not None and not properties
+                        and name not in _DOCX_TRANSPARENT):
+                    # Tabs, breaks, drawings, fields... end the word
+                    segments.append(None)
+
+            if token.endswith('/>'):
+                continue
+            delta = -1 if closing else 1
+            if name in enable:
+                enabled += delta
+                if kind == 'docx' and delta == 1:
+                    prefix = name.split(':', 1)[0]
+                    soft_break = '</%s><%s:softHyphen/><%s xml:space="preserve">' % (
+                        name, prefix, name)
+            elif name in skip:
+                skipped = max(0, skipped + delta)
+            enabled = max(0, enabled)
+
+        buffer = buffer[pos:]
+        if eof:
+            if paragraph is not None:
+                # Unclosed paragraph (malformed part): write it as it was read
+                out.extend(_hyphenate_paragraph(hyphenator, paragraph, segments, soft_break))
+            out.append(buffer)
+        if out:
+            dst.write(''.join(out).encode('utf-8'))
+        if eof:
+            return
+
+
+def _hyphenate_paragraph(hyphenator, pieces: List[str], segments: List[Optional[int]],
+                         soft_break: Optional[str]) -> List[str]:
+    """
+    Hyphenate the w:t texts of one DOCX paragraph as a single text
+
+    Breaks are mapped back onto the texts they fall in; a break between
+    two runs goes to the end of the first one.
+
+    Args:
+        hyphenator: GeorgianHyphenator with hyphen_char U+00AD
+        pieces: Markup and text of the paragraph, in order
+        segments: Index in pieces of each w:t text, None for separators
+        soft_break: Markup that replaces a break inside a w:t
+
+    Returns:
+        pieces, with the texts hyphenated
+    """
+    hyphen_char = hyphenator.hyphen_char
+    texts = [hyphenator._strip_hyphens(pieces[i]) if i is not None else '\n'
+             for i in segments]
+    joined = ''.join(texts)
+    hyphenated = hyphenator.hyphenate_text(joined) if joined.strip() else joined
+    if hyphenated.replace(hyphen_char, '') != joined:
+        # A dictionary value that does not spell its key: no offsets to
+        # map, so fall back to hyphenating each text on its own
+        hyphenated = None
+
+    k = 0
+    for index, text in zip(segments, texts):
+        if hyphenated is None:
+            if index is not None:
+                pieces[index] = hyphenator.hyphenate_text(text)
+                if soft_break:
+                    pieces[index] = pieces[index].replace(hyphen_char, soft_break)
+            continue
+        start = k
+        remaining = len(text)
+        while remaining:
+            if hyphenated[k] != hyphen_char:
+                remaining -= 1
+            k += 1
+        while k < len(hyphenated) and hyphenated[k] == hyphen_char:
+            k += 1
+        if index is not None:
+            piece = hyphenated[start:k]
+            if soft_break and hyphen_char in piece:
+                piece = piece.replace(hyphen_char, soft_break)
+            pieces[index] = piece
+    return pieces
+
+
+def _incomplete(buffer: str, pos: int) -> bool:
+    """Whether buffer[pos:] is (or may become) a comment, CDATA section or
+    processing instruction whose terminator has not been read yet"""
+    head = buffer[pos:pos + 9]
+    for opener, closer in _DELIMITED:
+        if head.startswith(opener):
+            return buffer.find(closer, pos + len(opener)) == -1
+        if opener.startswith(head):
+            return True
+    return False
+
+
+def _copy_raw(zin: zipfile.ZipFile, zout: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+    """
+    Copy a member's compressed bytes into zout without recompressing
+
+    zipfile has no public API for this, so the local header is rebuilt
+    from the central-directory entry and the data is copied verbatim.
+    """
+    zin.fp.seek(info.header_offset)
+    header = zin.fp.read(30)
+    name_len, extra_len = struct.unpack('<HH', header[26:30])
+    zin.fp.seek(info.header_offset + 30 + name_len + extra_len)
+
+    out_info = copy.copy(info)
+    out_info.flag_bits &= ~0x08  # sizes go in the header, no data descriptor
+    out_info.header_offset = zout.fp.tell()
+    zout.fp.write(out_info.FileHeader(zip64=info.compress_size > zipfile.ZIP64_LIMIT
+                                      or info.file_size > zipfile.ZIP64_LIMIT))
+
+    remaining = info.compress_size
+    while remaining > 0:
+        data = zin.fp.read(min(CHUNK_SIZE, remaining))
+        if not data:
+            raise zipfile.BadZipFile('truncated member %r' % info.filename)
+        zout.fp.write(data)
+        remaining -= len(data)
+
+    zout.filelist.append(out_info)
+    zout.NameToInfo[out_info.filename] = out_info
+    zout.start_dir = zout.fp.tell()
+    zout._didModify = True
+
+
+def _output_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+    out_info = zipfile.ZipInfo(info.filename, info.date_time)
+    out_info.compress_type = info.compress_type
+    out_info.external_attr = info.external_attr
+    out_info.comment = info.comment
+    return out_info
+
+
+def _rewrite_member_to_file(hyphenator, kind: str, path_in: str, name: str,
+                            path_tmp: str) -> str:
+    """Worker: hyphenate one member of path_in into a temporary file"""
+    with zipfile.ZipFile(path_in) as zin, zin.open(name) as src, \
+            open(path_tmp, 'wb') as dst:
+        rewrite_xml(hyphenator, kind, src, dst)
+    return path_tmp
+
+
+def hyphenate_document(hyphenator, path_in: str, path_out: str,
+                       workers: Optional[int] = None) -> int:
+    """
+    Hyphenate a DOCX, ODT or EPUB file
+
+    Args:
+        hyphenator: GeorgianHyphenator providing rules and dictionary
+        path_in: Source document
+        path_out: Destination document (must differ from path_in)
+        workers: Process count for rewriting parts in parallel
+                 (default: rewrite sequentially in this process)
+
+    Returns:
+        Number of XML parts that were rewritten
+
+    Raises:
+        ValueError: If the document kind is not supported
+    """
+    if os.path.abspath(path_in) == os.path.abspath(path_out):
+        raise ValueError('path_out must differ from path_in')
+
+    # Worker processes get a picklable copy (no open cache connection,
+    # recorder file or fragment cache lock)
+    portable = copy.copy(hyphenator)
+    portable._cache = None
+    portable._recorder = None
+    portable._fragment_cache = None
+
+    with zipfile.ZipFile(path_in) as zin:
+        kind = detect_document_kind(zin)
+        infos = zin.infolist()
+        targets = [info for info in infos if _is_target(kind, info.filename)]
+
+        futures: Dict[str, object] = {}
+        executor = None
+        tmp_dir = None
+        if workers and workers > 1 and len(targets) > 1:
+            tmp_dir = tempfile.mkdtemp(prefix='georgian-hyphenation-')
+            executor = ProcessPoolExecutor(max_workers=workers)
+            for index, info in enumerate(targets):
+                futures[info.filename] = executor.submit(
+                    _rewrite_member_to_file, portable, kind, path_in,
+                    info.filename, os.path.join(tmp_dir, '%d.xml' % index))
+
+        try:
+            with zipfile.ZipFile(path_out, 'w') as zout:
+                target_names = {info.filename for info in targets}
+                for info in infos:
+                    if info.filename not in target_names:
+                        _copy_raw(zin, zout, info)
+                        continue
+
+                    out_info = _output_info(info)
+                    force_zip64 = info.file_size > zipfile.ZIP64_LIMIT // 2
+                    with zout.open(out_info, 'w', force_zip64=force_zip64) as dst:
+                        if info.filename in futures:
+                            with open(futures[info.filename].result(), 'rb') as src:
+                                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+                        else:
+                            with zin.open(info) as src:
+                                rewrite_xml(portable, kind, src, dst)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return len(targets)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Fragment cache
+ფრაგმენტების ქეში
+
+Remembers the hyphenated form of whole text fragments (hyphenate_text()
+inputs and the text nodes of hyphenate_html()), so boilerplate that is
+rendered on every page (navigation labels, footers, template paragraphs)
+skips tokenization and per-word work entirely.
+
+Entries are keyed by the configuration fingerprint plus the fragment
+itself: Python's str hash is the content hash (computed once per string
+object and cached), and a hit is confirmed by comparing the text, so a
+hash collision can never return another fragment's result. The cache is
+bounded by the memory its entries use, not by their number.
+
+Usage:
+    fragments = FragmentCache(max_bytes=32 * 1024 * 1024)
+    h = GeorgianHyphenator().set_fragment_cache(fragments)
+    ...
+    print(fragments.stats())
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class FragmentCache:
+    """
+    In-memory LRU cache of hyphenated fragments, bounded by size in bytes
+
+    Features:
+    - Keyed by configuration fingerprint and content
+    - Least recently used fragments are evicted first
+    - Hit/miss/eviction counters and hit rate
+    - Can be shared by several hyphenators and threads
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024, min_length: int = 4,
+                 max_fragment_bytes: Optional[int] = None):
+        """
+        Create an empty cache
+
+        Args:
+            max_bytes: Memory budget for cached fragments and results
+            min_length: Fragments shorter than this are not cached (no
+                        Georgian word shorter than 4 letters is hyphenated)
+            max_fragment_bytes: Largest single entry to cache (default:
+                                1/16 of max_bytes, so one large document
+                                cannot flush the whole cache)
+        """
+        self.max_bytes = max_bytes
+        self.min_length = min_length
+        self.max_fragment_bytes = (max_fragment_bytes if max_fragment_bytes is not None
+                                   else max_bytes // 16)
+
+        self._entries: 'OrderedDict[Tuple[str, str], Tuple[str, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, fingerprint: str, fragment: str) -> Optional[str]:
+        """
+        Look up a hyphenated fragment
+
+        Args:
+            fingerprint: Configuration fingerprint of the caller
+            fragment: Text as passed to hyphenate_text()
+
+        Returns:
+            Hyphenated text, or None on a miss
+        """
+        key = (fingerprint, fragment)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, fingerprint: str, fragment: str, result: str) -> None:
+        """
+        Store a hyphenated fragment, evicting old ones if over budget
+
+        Args:
+            fingerprint: Configuration fingerprint of the caller
+            fragment: Text as passed to hyphenate_text()
+            result: Its hyphenated form
+        """
+        if len(fragment) < self.min_length:
+            return
+        size = _entry_size(fingerprint, fragment, result)
+        if size > self.max_fragment_bytes:
+            return
+
+        key = (fingerprint, fragment)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (result, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes and self._entries:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+                self.evictions += 1
+
+    def hit_rate(self) -> float:
+        """
+        Get the fraction of lookups that were hits
+
+        Returns:
+            Hit rate (0.0 before the first lookup)
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get the cache metrics
+
+        Returns:
+            Dictionary with 'entries', 'bytes', 'max_bytes', 'hits',
+            'misses', 'evictions' and 'hit_rate'
+        """
+        return {
+            'entries': len(self._entries),
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hit_rate(),
+        }
+
+    def clear(self) -> None:
+        """Drop all entries (metrics are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _entry_size(fingerprint: str, fragment: str, result: str) -> int:
+    # The fingerprint string is shared by all entries of a configuration;
+    # count the fragment and result objects plus the key/value tuples
+    return sys.getsizeof(fragment) + sys.getsizeof(result) + 2 * 64
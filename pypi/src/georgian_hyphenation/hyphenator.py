@@ -16,14 +16,20 @@ Enhanced with 17+ utility functions
 Author: Guram Zhgamadze
 """
 
+import hashlib
 import json
 import logging
 import os
 import re
-from typing import List, Dict, Set, Optional
+from typing import Any, Callable, List, Dict, Iterable, Iterator, Set, Optional, Tuple
+
+from .stats import CorpusStatistics
 
 logger = logging.getLogger(__name__)
 
+# Elements whose content hyphenate_html() and hyphenate_tree() leave alone
+_SKIP_TAGS = ('script', 'style', 'code', 'pre', 'textarea')
+
 
 class GeorgianHyphenator:
     """
@@ -64,6 +70,57 @@ class GeorgianHyphenator:
         
         # Dictionary for exception words
         self.dictionary: Dict[str, str] = {}
+        
+        # Bumped when the dictionary or cluster set is replaced; in-place
+        # edits are counted by the containers themselves (see _TrackedDict)
+        self._revision = 0
+        self._fingerprint_key: Optional[tuple] = None
+        self._fingerprint = ''
+        self._dictionary_digest_key: Optional[tuple] = None
+        self._dictionary_digest = ''
+        
+        # Optional persistent result cache (see set_cache)
+        self._cache = None
+        
+        # Alternative text engine (see set_engine); None = default engine
+        self._engine = None
+        
+        # Optional workload recorder (see set_recorder)
+        self._recorder = None
+        
+        # Optional whole-fragment cache (see set_fragment_cache)
+        self._fragment_cache = None
+    
+    @property
+    def dictionary(self) -> Dict[str, str]:
+        """Exception words -> hyphenated form ('-' marks breaks)"""
+        return self._dictionary
+    
+    @dictionary.setter
+    def dictionary(self, value: Dict[str, str]) -> None:
+        # Plain dicts are copied into a tracked dict so in-place edits
+        # change the fingerprint; read-only mappings (shared tables) are kept
+        if isinstance(value, dict) and not isinstance(value, _TrackedDict):
+            value = _TrackedDict(value)
+        self._dictionary = value
+        self._revision = getattr(self, '_revision', 0) + 1
+    
+    @property
+    def harmonic_clusters(self) -> Set[str]:
+        """Two-consonant clusters kept together at a break"""
+        return self._harmonic_clusters
+    
+    @harmonic_clusters.setter
+    def harmonic_clusters(self, value: Iterable[str]) -> None:
+        if not isinstance(value, _TrackedSet):
+            value = _TrackedSet(value)
+        self._harmonic_clusters = value
+        self._revision = getattr(self, '_revision', 0) + 1
+    
+    def _content_revision(self) -> tuple:
+        """Changes whenever the dictionary or cluster set is replaced or edited"""
+        return (self._revision, getattr(self._dictionary, 'revision', 0),
+                self._harmonic_clusters.revision)
     
     def _strip_hyphens(self, text: str) -> str:
         """
@@ -91,16 +148,28 @@ class GeorgianHyphenator:
         
         return text
     
-    def load_library(self, data: Dict[str, str]) -> None:
+    def load_library(self, data: Dict[str, str], prune: bool = False) -> None:
         """
         Load custom dictionary
         
         Args:
             data: Dictionary mapping words to their hyphenation
                   Example: {"საქართველო": "სა-ქარ-თვე-ლო"}
+            prune: Skip entries the algorithm already hyphenates identically
+                   under the current settings (an existing entry for such a
+                   word is removed, so the new value still wins). Pruned
+                   entries are not restored if clusters or minimums change
+                   later.
         """
         if data and isinstance(data, dict):
+            if prune:
+                kept = self.minimize_dictionary(data)
+                for word in data:
+                    if word not in kept:
+                        self.dictionary.pop(word, None)
+                data = kept
             self.dictionary.update(data)
+            self._revision += 1
     
     def load_default_library(self) -> None:
         """
@@ -144,51 +213,140 @@ class GeorgianHyphenator:
         Returns:
             Hyphenated word with configured hyphen character
         """
+        if self._recorder is not None and not self._recorder.busy():
+            return self._recorder.call(self, 'hyphenate', self.hyphenate, word)
+        
         # Strip only soft hyphens and zero-width spaces
         sanitized_word = self._strip_hyphens(word)
         if not sanitized_word:
             return ''
 
+        cache = self._cache
+        if cache is not None:
+            return self._hyphenate_cached(cache, sanitized_word)
+        return self._hyphenate_uncached(sanitized_word)
+    
+    def _hyphenate_uncached(self, sanitized_word: str) -> str:
+        """
+        Hyphenate a sanitized word from the dictionary or the algorithm
+        
+        Args:
+            sanitized_word: Word without soft hyphens
+            
+        Returns:
+            Hyphenated word
+        """
         # Split into leading punctuation / core word / trailing punctuation
         # so dictionary hits keep the surrounding characters intact
         match = re.match(r'^([^ა-ჰ]*)(.*?)([^ა-ჰ]*)$', sanitized_word, re.DOTALL)
         lead, core, trail = match.group(1), match.group(2), match.group(3)
 
         # Check dictionary first (core word only, punctuation re-attached)
-        if core and core in self.dictionary:
-            return lead + self.dictionary[core].replace('-', self.hyphen_char) + trail
+        hyphenated = self.dictionary.get(core) if core else None
+        if hyphenated is not None:
+            return lead + hyphenated.replace('-', self.hyphen_char) + trail
 
         # Fallback to algorithm
         return self.apply_algorithm(sanitized_word)
     
-    def apply_algorithm(self, word: str) -> str:
+    def _word_breaks(self, sanitized_word: str) -> Optional[List[int]]:
         """
-        Apply hyphenation algorithm
+        Get break offsets for a sanitized word, dictionary first
         
-        Algorithm Features:
-        - Vowel-based syllable detection
-        - Gemination (double consonant) handling
-        - Harmonic cluster preservation
-        - Anti-orphan protection (leftMin=2, rightMin=2)
+        Args:
+            sanitized_word: Word without soft hyphens
+            
+        Returns:
+            Ascending break offsets, or None when the dictionary entry
+            cannot be expressed as offsets (its value does not spell the key)
+        """
+        match = re.match(r'^([^ა-ჰ]*)(.*?)([^ა-ჰ]*)$', sanitized_word, re.DOTALL)
+        lead, core = match.group(1), match.group(2)
+        
+        hyphenated = self.dictionary.get(core) if core else None
+        if hyphenated is not None:
+            breaks = _parse_exception(core, hyphenated)
+            if breaks is None:
+                return None
+            return [len(lead) + pos for pos in sorted(breaks)]
+        
+        return self._break_points(sanitized_word)
+    
+    def _explain_breaks(self, word: str) -> Tuple[str, List[Tuple[int, str]], bool]:
+        """
+        Get break offsets of a plain Georgian word with the rule behind each
         
         Args:
-            word: Word to hyphenate
+            word: Georgian letters only (no punctuation)
+            
+        Returns:
+            Tuple of (spelled word, [(offset, branch)], dictionary_hit).
+            Dictionary hits report branch 'dictionary' and are spelled as
+            the dictionary value without hyphens.
+        """
+        hyphenated = self.dictionary.get(word)
+        if hyphenated is not None:
+            spelled = hyphenated.replace('-', '')
+            breaks = _parse_exception(spelled, hyphenated) or set()
+            return spelled, [(pos, 'dictionary') for pos in sorted(breaks)], True
+        
+        decisions, _ = self._analyze_word(word)
+        return word, [(pos, branch) for _, _, pos, branch, rejected_by in decisions
+                      if rejected_by is None], False
+    
+    def _hyphenate_cached(self, cache, sanitized_word: str) -> str:
+        """
+        Hyphenate a sanitized word through a persistent cache
+        
+        Args:
+            cache: The attached cache (read once by the caller, so a
+                   concurrent set_cache() cannot swap it mid-call)
+            sanitized_word: Word without soft hyphens
             
         Returns:
             Hyphenated word
         """
+        fingerprint = self.config_fingerprint()
+        breaks = cache.get(fingerprint, sanitized_word)
+        if breaks is None:
+            breaks = self._word_breaks(sanitized_word)
+            if breaks is None:
+                # Irregular dictionary entry: resolve without caching
+                return self._hyphenate_uncached(sanitized_word)
+            cache.put(fingerprint, sanitized_word, breaks)
+        return _insert_breaks(sanitized_word, breaks, self.hyphen_char)
+    
+    def _analyze_word(
+            self, word: str
+    ) -> Tuple[List[Tuple[int, int, int, str, Optional[str]]], Optional[str]]:
+        """
+        Run the rule cascade and report the decision for every vowel pair
+
+        Branch names: 'vowel-vowel', 'vowel-consonant-vowel', 'gemination',
+        'harmonic-cluster', 'default'. A candidate can be rejected by
+        'left-min', 'right-min' or 'compound-hyphen'.
+
+        Args:
+            word: Word to analyze
+
+        Returns:
+            Tuple of (decisions, skip_reason). Each decision is
+            (v1, v2, candidate_pos, branch, rejected_by) where rejected_by
+            is None for accepted breaks. skip_reason is 'short-word' or
+            'single-vowel' when the word is not analyzed at all.
+        """
         # Skip short words
         if len(word) < (self.left_min + self.right_min):
-            return word
+            return [], 'short-word'
         
         # Find all vowel positions
         vowel_indices = [i for i, char in enumerate(word) if char in self.vowels]
         
         # Need at least 2 vowels for hyphenation
         if len(vowel_indices) < 2:
-            return word
+            return [], 'single-vowel'
         
-        insert_points = []
+        decisions = []
         
         # Analyze each vowel pair
         for i in range(len(vowel_indices) - 1):
@@ -197,14 +355,14 @@ class GeorgianHyphenator:
             distance = v2 - v1 - 1  # Number of consonants between vowels
             between_substring = word[v1 + 1:v2]
             
-            candidate_pos = -1
-            
             if distance == 0:
                 # V-V: Split between vowels
                 candidate_pos = v1 + 1
+                branch = 'vowel-vowel'
             elif distance == 1:
                 # V-C-V: Split after vowel
                 candidate_pos = v1 + 1
+                branch = 'vowel-consonant-vowel'
             else:
                 # V-CC...C-V: Complex case
                 
@@ -218,36 +376,63 @@ class GeorgianHyphenator:
                 if double_consonant_index != -1:
                     # Split between double consonants
                     candidate_pos = v1 + 1 + double_consonant_index + 1
+                    branch = 'gemination'
+                elif between_substring[distance - 2:distance] in self.harmonic_clusters:
+                    # Split before harmonic cluster
+                    candidate_pos = v1 + 1 + distance - 2
+                    branch = 'harmonic-cluster'
                 else:
-                    # Check for harmonic clusters
-                    break_index = -1
-                    if distance >= 2:
-                        last_two = between_substring[distance - 2:distance]
-                        if last_two in self.harmonic_clusters:
-                            break_index = distance - 2
-                    
-                    if break_index != -1:
-                        # Split before harmonic cluster
-                        candidate_pos = v1 + 1 + break_index
-                    else:
-                        # Default: split after first consonant
-                        candidate_pos = v1 + 2
+                    # Default: split after first consonant
+                    candidate_pos = v1 + 2
+                    branch = 'default'
             
             # Anti-orphan protection: ensure minimum chars on each side.
             # Never break adjacent to an existing compound-word hyphen
             # (it already acts as a break point).
-            if (candidate_pos >= self.left_min
-                    and (len(word) - candidate_pos) >= self.right_min
-                    and word[candidate_pos] != '-'
-                    and word[candidate_pos - 1] != '-'):
-                insert_points.append(candidate_pos)
+            if candidate_pos < self.left_min:
+                rejected_by = 'left-min'
+            elif (len(word) - candidate_pos) < self.right_min:
+                rejected_by = 'right-min'
+            elif word[candidate_pos] == '-' or word[candidate_pos - 1] == '-':
+                rejected_by = 'compound-hyphen'
+            else:
+                rejected_by = None
+            
+            decisions.append((v1, v2, candidate_pos, branch, rejected_by))
         
-        # Insert hyphens (from right to left to maintain positions)
-        result = list(word)
-        for pos in reversed(insert_points):
-            result.insert(pos, self.hyphen_char)
+        return decisions, None
+    
+    def _break_points(self, word: str) -> List[int]:
+        """
+        Get the accepted break offsets for a word (algorithm only)
         
-        return ''.join(result)
+        Args:
+            word: Word to analyze
+            
+        Returns:
+            Ascending list of offsets where a hyphen is inserted
+        """
+        decisions, _ = self._analyze_word(word)
+        return [pos for _, _, pos, _, rejected_by in decisions
+                if rejected_by is None]
+    
+    def apply_algorithm(self, word: str) -> str:
+        """
+        Apply hyphenation algorithm
+        
+        Algorithm Features:
+        - Vowel-based syllable detection
+        - Gemination (double consonant) handling
+        - Harmonic cluster preservation
+        - Anti-orphan protection (leftMin=2, rightMin=2)
+        
+        Args:
+            word: Word to hyphenate
+            
+        Returns:
+            Hyphenated word
+        """
+        return _insert_breaks(word, self._break_points(word), self.hyphen_char)
     
     def get_syllables(self, word: str) -> List[str]:
         """
@@ -282,6 +467,25 @@ class GeorgianHyphenator:
         if not text:
             return ''
         
+        if self._recorder is not None and not self._recorder.busy():
+            return self._recorder.call(self, 'hyphenate_text', self.hyphenate_text, text)
+        
+        fragments = self._fragment_cache
+        if fragments is not None and len(text) >= fragments.min_length:
+            fingerprint = self.config_fingerprint()
+            result = fragments.get(fingerprint, text)
+            if result is None:
+                result = self._hyphenate_text(text)
+                fragments.put(fingerprint, text, result)
+            return result
+        
+        return self._hyphenate_text(text)
+    
+    def _hyphenate_text(self, text: str) -> str:
+        """hyphenate_text() without the recorder and fragment cache"""
+        if self._engine is not None:
+            return self._engine.hyphenate_text(self, text)
+        
         # Strip only soft hyphens and zero-width spaces
         sanitized_text = self._strip_hyphens(text)
         
@@ -340,6 +544,28 @@ class GeorgianHyphenator:
         hyphenated = self.hyphenate(word)
         return hyphenated.count(self.hyphen_char)
     
+    def collect_statistics(self, texts: Iterable[str],
+                           stats: Optional[CorpusStatistics] = None) -> CorpusStatistics:
+        """
+        Aggregate syllable and break statistics over texts in one pass
+        
+        Works from break offsets directly, so no hyphenated strings are
+        built. Equivalent to calling count_syllables()/get_syllables()
+        on every Georgian word, at a fraction of the allocations.
+        
+        Args:
+            texts: Iterable of independent texts (e.g. lines of a file)
+            stats: Existing partial result to add to
+            
+        Returns:
+            CorpusStatistics (mergeable across processes)
+        """
+        if stats is None:
+            stats = CorpusStatistics()
+        for text in texts:
+            stats.update(self, text)
+        return stats
+    
     def is_georgian(self, text: str) -> bool:
         """
         Check if text contains only Georgian characters
@@ -394,9 +620,11 @@ class GeorgianHyphenator:
         if not html:
             return ''
         
+        if self._recorder is not None and not self._recorder.busy():
+            return self._recorder.call(self, 'hyphenate_html', self.hyphenate_html, html)
+        
         # Tags to skip entirely
-        skip_tags = ['script', 'style', 'code', 'pre', 'textarea']
-        skip_pattern = '|'.join(skip_tags)
+        skip_pattern = '|'.join(_SKIP_TAGS)
         
         # Store skipped content
         skipped = []
@@ -431,6 +659,109 @@ class GeorgianHyphenator:
         
         return result
     
+    def hyphenate_tree(self, element: Any,
+                       skip: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        Hyphenate a parsed element tree in place
+        
+        Rewrites the ``.text`` and ``.tail`` of every element with
+        hyphenate_text(), without a serialize/parse round trip. Works with
+        xml.etree.ElementTree and lxml elements. Content of <script>,
+        <style>, <code>, <pre> and <textarea> (namespaces and case are
+        ignored) is left alone, as in hyphenate_html().
+        
+        Args:
+            element: Root element to process (its own tail is not touched)
+            skip: Optional predicate; elements for which it returns True
+                  are skipped with all their descendants, e.g.
+                  ``lambda el: el.get('lang', 'ka') != 'ka'`` or
+                  ``lambda el: 'no-hyphens' in el.get('class', '').split()``
+            
+        Returns:
+            The same element
+        """
+        # (element, whether the element's parent content is skipped)
+        stack = [(element, False)]
+        while stack:
+            node, parent_skipped = stack.pop()
+            tag = node.tag
+            if not isinstance(tag, str):
+                # Comments, processing instructions and entities
+                skipped = True
+            else:
+                skipped = (parent_skipped
+                           or tag.rsplit('}', 1)[-1].lower() in _SKIP_TAGS
+                           or (skip is not None and skip(node)))
+            
+            if node.text and not skipped:
+                node.text = self.hyphenate_text(node.text)
+            # A tail follows the element, so it belongs to the parent
+            if node.tail and not parent_skipped and node is not element:
+                node.tail = self.hyphenate_text(node.tail)
+            
+            stack.extend((child, skipped) for child in reversed(node))
+        
+        return element
+    
+    def hyphenate_markdown(self, markdown: str) -> str:
+        """
+        Hyphenate the prose of a Markdown document
+        
+        Code blocks, code spans, raw HTML, autolinks and link destinations
+        are left untouched, without rendering the document to HTML.
+        
+        Args:
+            markdown: Markdown source
+            
+        Returns:
+            Markdown with hyphenated prose
+        """
+        from .markdown import MarkdownHyphenator
+        stream = MarkdownHyphenator(self)
+        return stream.feed(markdown) + stream.close()
+    
+    def hyphenate_markdown_stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Hyphenate a Markdown document that arrives in chunks
+        
+        Memory use depends on the longest line, not on the document size.
+        
+        Args:
+            chunks: Pieces of the Markdown source, split anywhere
+            
+        Yields:
+            Hyphenated output, one piece per completed run of lines
+        """
+        from .markdown import MarkdownHyphenator
+        stream = MarkdownHyphenator(self)
+        for chunk in chunks:
+            output = stream.feed(chunk)
+            if output:
+                yield output
+        output = stream.close()
+        if output:
+            yield output
+    
+    def hyphenate_document(self, path_in: str, path_out: str,
+                           workers: Optional[int] = None) -> int:
+        """
+        Hyphenate a DOCX, ODT or EPUB file
+        
+        Zip members are streamed: only prose text nodes of the XML parts
+        are rewritten, everything else is copied without recompression.
+        
+        Args:
+            path_in: Source document
+            path_out: Destination document
+            workers: Process count for rewriting parts (e.g. EPUB chapters)
+                     in parallel (default: sequential)
+            
+        Returns:
+            Number of XML parts that were rewritten
+        """
+        from .documents import hyphenate_document
+        return hyphenate_document(self, path_in, path_out, workers=workers)
+    
     def set_left_min(self, value: int) -> 'GeorgianHyphenator':
         """
         Set the minimum characters before first hyphen
@@ -473,6 +804,136 @@ class GeorgianHyphenator:
             self.hyphen_char = char
         return self
     
+    def config_fingerprint(self) -> str:
+        """
+        Get a fingerprint of everything that affects hyphenation output
+        
+        Covers hyphen_char, left/right min, vowels, the cluster set and the
+        dictionary contents. Recomputed only after something changed:
+        setters, dictionary/cluster methods and in-place edits of
+        ``dictionary`` or ``harmonic_clusters`` are all tracked. The
+        dictionary is digested once per change (shared tables carry their
+        digest in the header, so attached workers never walk the table).
+        
+        Returns:
+            16-character hex digest
+        """
+        key = (self._content_revision(), self.hyphen_char, self.left_min,
+               self.right_min, self.vowels)
+        if key != self._fingerprint_key:
+            payload = json.dumps(
+                [self.hyphen_char, self.left_min, self.right_min, self.vowels,
+                 sorted(self.harmonic_clusters), self._dictionary_fingerprint()],
+                ensure_ascii=False, separators=(',', ':'))
+            self._fingerprint = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+            self._fingerprint_key = key
+        return self._fingerprint
+    
+    def _dictionary_fingerprint(self) -> str:
+        """Digest of the dictionary contents, recomputed once per change"""
+        key = self._content_revision()[:2]
+        if key != self._dictionary_digest_key:
+            self._dictionary_digest = getattr(self.dictionary, 'fingerprint', None) \
+                or _dictionary_digest(self.dictionary)
+            self._dictionary_digest_key = key
+        return self._dictionary_digest
+    
+    def set_cache(self, cache, preload: int = 0) -> 'GeorgianHyphenator':
+        """
+        Attach a persistent word -> break positions cache
+        
+        Entries are keyed by config_fingerprint(), which also follows
+        in-place edits of ``dictionary`` and ``harmonic_clusters``.
+        
+        Args:
+            cache: PersistentCache instance, or None to detach
+            preload: Load this many of the most frequent cached words
+                     for the current configuration into memory now
+            
+        Returns:
+            Self for method chaining
+        """
+        self._cache = cache
+        if cache is not None and preload > 0:
+            cache.preload(self.config_fingerprint(), preload)
+        return self
+    
+    def set_fragment_cache(self, cache) -> 'GeorgianHyphenator':
+        """
+        Attach an in-memory cache of hyphenated fragments
+        
+        Every hyphenate_text() input (and so every text node of
+        hyphenate_html() and hyphenate_tree()) is looked up as a whole
+        before it is tokenized. A cache can be shared by hyphenators with
+        different configurations; direct edits of ``dictionary`` or
+        ``harmonic_clusters`` change the fingerprint too, so earlier
+        entries are not reused.
+        
+        Args:
+            cache: FragmentCache instance, or None to detach
+            
+        Returns:
+            Self for method chaining
+        """
+        self._fragment_cache = cache
+        return self
+    
+    def set_recorder(self, recorder) -> 'GeorgianHyphenator':
+        """
+        Attach a workload recorder for hyphenate(), hyphenate_text() and
+        hyphenate_html() calls
+        
+        Args:
+            recorder: WorkloadRecorder instance, or None to detach
+            
+        Returns:
+            Self for method chaining
+        """
+        self._recorder = recorder
+        return self
+    
+    def set_engine(self, name: str) -> 'GeorgianHyphenator':
+        """
+        Choose the engine used by hyphenate_text() and hyphenate_html()
+        
+        Args:
+            name: 'default' (per-word Python rules) or 'regex' (the rule
+                  set compiled into regular expressions, one C-level pass
+                  per text; same output, recompiled after any change to
+                  the clusters or dictionary keys, in place or not)
+            
+        Returns:
+            Self for method chaining
+            
+        Raises:
+            ValueError: If the engine name is unknown
+        """
+        if name == 'regex':
+            from .regex_engine import RegexEngine
+            self._engine = RegexEngine()
+        elif name == 'default':
+            self._engine = None
+        else:
+            raise ValueError("engine must be 'default' or 'regex', got %r" % (name,))
+        return self
+    
+    def use_shared_tables(self, tables) -> 'GeorgianHyphenator':
+        """
+        Use a shared dictionary/cluster table instead of private copies
+        
+        The dictionary becomes read-only: load_library(), add_exception()
+        and remove_exception() are not available while it is attached.
+        
+        Args:
+            tables: SharedTables from SharedTables.create()/attach()
+            
+        Returns:
+            Self for method chaining
+        """
+        self.dictionary = tables
+        self.harmonic_clusters = tables.clusters
+        return self
+    
     def add_exception(self, word: str, hyphenated: str) -> 'GeorgianHyphenator':
         """
         Add a single hyphenation exception to dictionary
@@ -486,6 +947,7 @@ class GeorgianHyphenator:
         """
         if word and hyphenated:
             self.dictionary[word] = hyphenated
+            self._revision += 1
         return self
     
     def remove_exception(self, word: str) -> bool:
@@ -500,6 +962,7 @@ class GeorgianHyphenator:
         """
         if word in self.dictionary:
             del self.dictionary[word]
+            self._revision += 1
             return True
         return False
     
@@ -533,6 +996,7 @@ class GeorgianHyphenator:
         """
         if isinstance(cluster, str) and len(cluster) == 2:
             self.harmonic_clusters.add(cluster)
+            self._revision += 1
         return self
     
     def remove_harmonic_cluster(self, cluster: str) -> bool:
@@ -547,6 +1011,7 @@ class GeorgianHyphenator:
         """
         if cluster in self.harmonic_clusters:
             self.harmonic_clusters.remove(cluster)
+            self._revision += 1
             return True
         return False
     
@@ -559,6 +1024,247 @@ class GeorgianHyphenator:
         """
         return sorted(list(self.harmonic_clusters))
 
+    # ========================================
+    # DICTIONARY MINIMIZATION
+    # ========================================
+    
+    def explain_exception(self, word: str, hyphenated: str) -> List[Dict[str, object]]:
+        """
+        Compare a dictionary entry with the algorithm under current settings
+        
+        Args:
+            word: Dictionary key (plain word)
+            hyphenated: Dictionary value (use '-' for breaks)
+            
+        Returns:
+            One record per disagreeing offset with keys 'position',
+            'dictionary' (True if the entry breaks there), 'branch'
+            (algorithm branch responsible for that offset) and
+            'rejected_by' (guard that dropped the algorithm's candidate,
+            or None). An empty list means the entry is redundant.
+        """
+        expected = _parse_exception(word, hyphenated)
+        if expected is None:
+            return [{'position': -1, 'dictionary': True,
+                     'branch': 'unparsable', 'rejected_by': None}]
+        
+        decisions, skip_reason = self._analyze_word(word)
+        actual = {pos for _, _, pos, _, rejected_by in decisions
+                  if rejected_by is None}
+        
+        report = []
+        for pos in sorted(actual.symmetric_difference(expected)):
+            branch, rejected_by = skip_reason or 'no-vowel-pair', None
+            for v1, v2, candidate_pos, pair_branch, pair_rejected in decisions:
+                if v1 < pos <= v2:
+                    branch = pair_branch
+                    if candidate_pos == pos:
+                        rejected_by = pair_rejected
+                    break
+            report.append({'position': pos, 'dictionary': pos in expected,
+                           'branch': branch, 'rejected_by': rejected_by})
+        return report
+    
+    def find_redundant_exceptions(self, data: Optional[Dict[str, str]] = None) -> List[str]:
+        """
+        List dictionary entries the algorithm already gets right
+        
+        Args:
+            data: Dictionary to check (default: the loaded dictionary)
+            
+        Returns:
+            Sorted list of redundant words
+        """
+        if data is None:
+            data = self.dictionary
+        return sorted(word for word, hyphenated in data.items()
+                      if not self.explain_exception(word, hyphenated))
+    
+    def minimize_dictionary(self, data: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """
+        Drop every entry the algorithm reproduces under current settings
+        
+        Args:
+            data: Dictionary to minimize (default: the loaded dictionary)
+            
+        Returns:
+            New dictionary with only the entries that are still needed
+        """
+        if data is None:
+            data = self.dictionary
+        redundant = set(self.find_redundant_exceptions(data))
+        return {word: hyphenated for word, hyphenated in data.items()
+                if word not in redundant}
+    
+    def suggest_harmonic_clusters(
+            self, data: Optional[Dict[str, str]] = None) -> List[Tuple[str, int]]:
+        """
+        Find consonant pairs the dictionary keeps together as a syllable onset
+        
+        Counts entries where the dictionary breaks right before the last two
+        consonants of a V-CC...C-V run but the algorithm used its default
+        split. Promoting a frequent pair with add_harmonic_cluster() makes
+        those entries redundant.
+        
+        Args:
+            data: Dictionary to scan (default: the loaded dictionary)
+            
+        Returns:
+            List of (cluster, count), most frequent first
+        """
+        if data is None:
+            data = self.dictionary
+        
+        counts: Dict[str, int] = {}
+        for word, hyphenated in data.items():
+            expected = _parse_exception(word, hyphenated)
+            if expected is None:
+                continue
+            decisions, _ = self._analyze_word(word)
+            for v1, v2, candidate_pos, branch, _ in decisions:
+                cluster = word[v2 - 2:v2]
+                if (branch == 'default' and v2 - v1 >= 3
+                        and (v2 - 2) in expected and candidate_pos not in expected
+                        and cluster not in self.harmonic_clusters):
+                    counts[cluster] = counts.get(cluster, 0) + 1
+        
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+
+class _TrackedDict(dict):
+    """dict that counts its in-place modifications in ``revision``"""
+
+    revision = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.revision += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.revision += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.revision += 1
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.revision += 1
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        self.revision += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.revision += 1
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self.revision += 1
+
+
+class _TrackedSet(set):
+    """set that counts its in-place modifications in ``revision``"""
+
+    revision = 0
+
+    def _modified(self, result=None):
+        self.revision += 1
+        return result
+
+    def add(self, item):
+        super().add(item)
+        self._modified()
+
+    def discard(self, item):
+        super().discard(item)
+        self._modified()
+
+    def remove(self, item):
+        super().remove(item)
+        self._modified()
+
+    def pop(self):
+        return self._modified(super().pop())
+
+    def clear(self):
+        super().clear()
+        self._modified()
+
+    def update(self, *others):
+        super().update(*others)
+        self._modified()
+
+    def difference_update(self, *others):
+        super().difference_update(*others)
+        self._modified()
+
+    def intersection_update(self, *others):
+        super().intersection_update(*others)
+        self._modified()
+
+    def symmetric_difference_update(self, other):
+        super().symmetric_difference_update(other)
+        self._modified()
+
+    def __ior__(self, other):
+        return self._modified(super().__ior__(other))
+
+    def __iand__(self, other):
+        return self._modified(super().__iand__(other))
+
+    def __isub__(self, other):
+        return self._modified(super().__isub__(other))
+
+    def __ixor__(self, other):
+        return self._modified(super().__ixor__(other))
+
+
+def _insert_breaks(word: str, breaks: List[int], hyphen_char: str) -> str:
+    """Join slices of word with hyphen_char at the given ascending offsets"""
+    if not breaks:
+        return word
+    pieces = []
+    start = 0
+    for pos in breaks:
+        pieces.append(word[start:pos])
+        start = pos
+    pieces.append(word[start:])
+    return hyphen_char.join(pieces)
+
+
+def _dictionary_digest(dictionary: Dict[str, str]) -> str:
+    """Digest of dictionary contents (part of config_fingerprint())"""
+    payload = json.dumps(sorted(dictionary.items()), ensure_ascii=False,
+                         separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _parse_exception(word: str, hyphenated: str) -> Optional[Set[int]]:
+    """
+    Convert a dictionary value into break offsets within its key
+
+    Returns None when the value does not spell the key (or the key itself
+    contains a compound hyphen, which makes '-' ambiguous).
+    """
+    if '-' in word or hyphenated.replace('-', '') != word:
+        return None
+    breaks = set()
+    offset = 0
+    for char in hyphenated:
+        if char == '-':
+            breaks.add(offset)
+        else:
+            offset += 1
+    return breaks
+
 
 # Convenience functions for backward compatibility and quick usage
 
@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+"""
+Markdown-aware hyphenation
+Markdown ტექსტის დამარცვლა
+
+Hyphenates the prose of a Markdown document in one pass over its lines,
+without rendering it to HTML. Only text that a renderer would show as
+prose goes through hyphenate_text(); these are copied unchanged:
+
+- fenced (``` / ~~~) and indented code blocks
+- inline code spans and the content of inline <code>, <pre>, <script>,
+  <style> and <textarea> elements
+- raw HTML blocks and inline tags, comments and processing instructions
+- autolinks (<https://...>, <user@example.com>) and bare http(s)/www URLs
+- link and image destinations and titles, and the destinations of link
+  reference definitions
+
+Input is consumed as a stream of chunks. Only the current, incomplete line
+and a few flags are kept between chunks, so memory use depends on the
+longest line, not on the document size.
+
+Where the structure is ambiguous without look-ahead (e.g. a code span
+whose closing backticks never come), the text is left unhyphenated rather
+than risk rewriting code.
+
+Usage:
+    h = GeorgianHyphenator()
+    h.hyphenate_markdown(text)
+    for piece in h.hyphenate_markdown_stream(chunks):
+        out.write(piece)
+
+    python -m georgian_hyphenation.markdown README.ka.md -o README.hyphenated.md
+"""
+
+import argparse
+import io
+import re
+import sys
+from typing import Dict, List, Optional, Pattern
+
+from .hyphenator import GeorgianHyphenator, _SKIP_TAGS
+
+CHUNK_SIZE = 1 << 16
+
+# Blockquote markers in front of a line
+_QUOTES = re.compile(r'(?:[ ]{0,3}>[ ]?)*')
+_LIST_ITEM = re.compile(r'[ ]{0,3}(?:[-+*]|[0-9]{1,9}[.)])(?:[ \t]+|$)')
+
+# Block starts below are matched after the line's indentation
+_FENCE = re.compile(r'(`{3,}|~{3,})(.*)')
+_REFERENCE = re.compile(r'\[((?:[^\[\]\\]|\\.)+)\]:')
+
+# HTML block starts (CommonMark types 1-6) -> end marker; '' = blank line,
+# None = closing tag of the element that was opened
+_HTML_BLOCKS = [
+    (re.compile(r'<(script|pre|style|textarea)(?:[\s>]|$)', re.I), None),
+    (re.compile(r'<!--'), '-->'),
+    (re.compile(r'<\?'), '?>'),
+    (re.compile(r'<![A-Za-z]'), '>'),
+    (re.compile(r'<!\[CDATA\['), ']]>'),
+    (re.compile(
+        r'</?(?:address|article|aside|base|basefont|blockquote|body|'
+        r'caption|center|col|colgroup|dd|details|dialog|dir|div|dl|dt|'
+        r'fieldset|figcaption|figure|footer|form|frame|frameset|h[1-6]|head|'
+        r'header|hr|html|iframe|legend|li|link|main|menu|menuitem|nav|'
+        r'noframes|ol|optgroup|option|p|param|search|section|summary|table|'
+        r'tbody|td|tfoot|th|thead|title|tr|track|ul)(?:[\s>]|/>|$)', re.I), ''),
+]
+# Type 7 (any other complete tag alone on its line) cannot interrupt a paragraph
+_HTML_TAG_LINE = re.compile(
+    r'(?:<[A-Za-z][A-Za-z0-9-]*(?:\s[^<>]*)?/?>|</[A-Za-z][A-Za-z0-9-]*\s*>)\s*$')
+
+# Inline constructs that are not prose; anything between matches is prose
+_INLINE = re.compile(r'''
+    \\[!-/:-@\[-`{-~]
+  | (?P<ticks>`+)
+  | <[A-Za-z][A-Za-z0-9+.-]{1,31}:[^\s<>]*>
+  | <[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+@[A-Za-z0-9][A-Za-z0-9.-]*>
+  | <!--.*?-->
+  | <\?.*?\?>
+  | <!\[CDATA\[.*?\]\]>
+  | <![A-Za-z][^>]*>
+  | (?P<tag></?(?P<name>[A-Za-z][A-Za-z0-9-]*)(?:\s[^<>]*)?/?>)
+  | \]\(\s*(?:<[^<>]*>|[^\s()<]*(?:\([^\s()]*\)[^\s()]*)*)
+      (?:\s+(?:"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|\((?:[^()\\]|\\.)*\)))?\s*\)
+  | (?:https?://|www\.)[^\s<>]*
+''', re.X)
+
+_closers: Dict[str, Pattern] = {}
+
+
+def _closer(key: str) -> Pattern:
+    """Expression for the end of a code span (backtick run) or skipped element"""
+    pattern = _closers.get(key)
+    if pattern is None:
+        if key.startswith('`'):
+            pattern = re.compile('(?<!`)%s(?!`)' % key)
+        else:
+            pattern = re.compile(r'</%s\s*>' % re.escape(key), re.I)
+        _closers[key] = pattern
+    return pattern
+
+
+def _columns(text: str) -> int:
+    """Width of leading whitespace (tab stops every 4 columns)"""
+    width = 0
+    for ch in text:
+        if ch == ' ':
+            width += 1
+        elif ch == '\t':
+            width += 4 - width % 4
+        else:
+            break
+    return width
+
+
+class MarkdownHyphenator:
+    """
+    Incremental Markdown hyphenator
+
+    feed() accepts chunks of any size and returns the output for every
+    line completed so far; close() flushes the last line.
+    """
+
+    def __init__(self, hyphenator: GeorgianHyphenator):
+        self.hyphenator = hyphenator
+        self._pending: List[str] = []
+
+        # Block state
+        self._fence: Optional[str] = None          # opening fence run
+        self._html_end: Optional[str] = None       # end marker of an HTML block
+        self._paragraph = False                    # previous line was prose
+        self._list_indent = 0                      # content column of the open list item
+
+        # Inline state carried to the next line of a paragraph
+        self._open: Optional[str] = None           # backtick run or skipped tag name
+
+    def feed(self, chunk: str) -> str:
+        """
+        Process a chunk of Markdown
+
+        Args:
+            chunk: Next piece of the document (may end mid-line)
+
+        Returns:
+            Hyphenated output for the lines completed by this chunk
+        """
+        end = chunk.rfind('\n')
+        if end < 0:
+            if chunk:
+                self._pending.append(chunk)
+            return ''
+        self._pending.append(chunk[:end + 1])
+        text = ''.join(self._pending)
+        self._pending = [chunk[end + 1:]] if end + 1 < len(chunk) else []
+
+        lines = text.split('\n')
+        lines.pop()
+        return ''.join([self._line(line, '\n') for line in lines])
+
+    def close(self) -> str:
+        """
+        Flush the final line and reset for a new document
+
+        Returns:
+            Hyphenated output for the text after the last newline
+        """
+        text = ''.join(self._pending)
+        output = self._line(text, '') if text else ''
+        self._pending = []
+        self._fence = self._html_end = self._open = None
+        self._paragraph = False
+        self._list_indent = 0
+        return output
+
+    # ========================================
+    # BLOCKS
+    # ========================================
+
+    def _line(self, line: str, newline: str) -> str:
+        """Hyphenate one line (without its newline)"""
+        if line.endswith('\r'):
+            line, newline = line[:-1], '\r' + newline
+        verbatim = line + newline
+
+        if self._fence is not None:
+            match = _FENCE.match(line[_QUOTES.match(line).end():].lstrip(' \t'))
+            if (match and match.group(1)[0] == self._fence[0]
+                    and len(match.group(1)) >= len(self._fence)
+                    and not match.group(2).strip()):
+                self._fence = None
+            return verbatim
+
+        if self._html_end is not None:
+            if self._html_end == '':
+                if not line.strip():
+                    self._html_end = None
+                    self._paragraph = False
+            elif self._html_end in line.lower():
+                self._html_end = None
+            return verbatim
+
+        start = _QUOTES.match(line).end()
+        if not line[start:].strip():
+            self._paragraph = False
+            self._open = None
+            return verbatim
+
+        indent = _columns(line[start:])
+        if not self._paragraph and indent >= self._list_indent + 4:
+            # Indented code block
+            return verbatim
+
+        item = _LIST_ITEM.match(line, start)
+        if item:
+            # Nested blocks are indented relative to the item's content
+            self._list_indent = len(line[start:item.end()].expandtabs(4))
+            if item.end() == len(line):
+                self._list_indent += 1
+            self._paragraph = False
+            self._open = None
+            start = item.end()
+        elif indent < self._list_indent and not self._paragraph:
+            self._list_indent = 0
+        start += len(line) - start - len(line[start:].lstrip(' \t'))
+        text = line[start:]
+
+        if self._block(text):
+            self._paragraph = False
+            self._open = None
+            return verbatim
+
+        reference = None if self._paragraph else _REFERENCE.match(text)
+        if reference:
+            # Labels are hyphenated like the link text that refers to them,
+            # so [label] and [label]: url still match; the URL is kept
+            return (line[:start + 1] + self.hyphenator.hyphenate_text(reference.group(1))
+                    + line[start + reference.end(1):] + newline)
+
+        self._paragraph = True
+        return line[:start] + self._inline(text) + newline
+
+    def _block(self, text: str) -> bool:
+        """Open a fenced code or HTML block if the line starts one"""
+        fence = _FENCE.match(text)
+        if fence and not (fence.group(1)[0] == '`' and '`' in fence.group(2)):
+            self._fence = fence.group(1)
+            return True
+
+        if not text.startswith('<'):
+            return False
+        for pattern, end in _HTML_BLOCKS:
+            match = pattern.match(text)
+            if match is None:
+                continue
+            if end is None:
+                end = '</' + match.group(1).lower() + '>'
+            # Types 1-5 may end on the line that starts them
+            if not end or end not in text[match.end():].lower():
+                self._html_end = end
+            return True
+        if not self._paragraph and _HTML_TAG_LINE.match(text):
+            self._html_end = ''
+            return True
+        return False
+
+    # ========================================
+    # INLINES
+    # ========================================
+
+    def _inline(self, text: str) -> str:
+        """Hyphenate the prose of one paragraph line"""
+        hyphenate_text = self.hyphenator.hyphenate_text
+        out = []
+        pos = 0
+
+        if self._open is not None:
+            closer = _closer(self._open).search(text)
+            if closer is None:
+                return text
+            out.append(text[:closer.end()])
+            pos = closer.end()
+            self._open = None
+
+        while True:
+            match = _INLINE.search(text, pos)
+            if match is None:
+                break
+            if match.start() > pos:
+                out.append(hyphenate_text(text[pos:match.start()]))
+
+            key = match.group('ticks')
+            name = match.group('name')
+            if key is None and name is not None and name.lower() in _SKIP_TAGS:
+                tag = match.group('tag')
+                if not tag.startswith('</') and not tag.endswith('/>'):
+                    key = name.lower()
+            if key is None:
+                out.append(match.group(0))
+                pos = match.end()
+                continue
+
+            # Code span or skipped element: copy through its end, which
+            # may be on a later line of the paragraph
+            closer = _closer(key).search(text, match.end())
+            if closer is None:
+                self._open = key
+                out.append(text[match.start():])
+                return ''.join(out)
+            out.append(text[match.start():closer.end()])
+            pos = closer.end()
+
+        if pos < len(text):
+            out.append(hyphenate_text(text[pos:]))
+        return ''.join(out)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(
+        prog='python -m georgian_hyphenation.markdown',
+        description='Hyphenate the prose of a Markdown file, leaving code, '
+                    'URLs and HTML untouched.')
+    parser.add_argument('input', nargs='?', help='Markdown file (default: stdin)')
+    parser.add_argument('-o', '--output', help='file to write (default: stdout)')
+    parser.add_argument('--hyphen-char', default='\u00AD',
+                        help='hyphen character (default: U+00AD soft hyphen)')
+    parser.add_argument('--no-dictionary', action='store_true',
+                        help='do not load the bundled exceptions dictionary')
+    args = parser.parse_args(argv)
+
+    h = GeorgianHyphenator(args.hyphen_char)
+    if not args.no_dictionary:
+        h.load_default_library()
+
+    src = (open(args.input, 'r', encoding='utf-8', newline='') if args.input
+           else io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8', newline=''))
+    dst = (open(args.output, 'w', encoding='utf-8', newline='') if args.output
+           else io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', newline=''))
+    try:
+        for piece in h.hyphenate_markdown_stream(iter(lambda: src.read(CHUNK_SIZE), '')):
+            dst.write(piece)
+    finally:
+        dst.flush()
+        if args.input:
+            src.close()
+        if args.output:
+            dst.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Dictionary minimizer
+ლექსიკონის შემცირება
+
+Compares every exception entry with the algorithm under the chosen
+settings, reports entries that are redundant, writes a minimized
+dictionary and lists which algorithm branch disagreed for the rest.
+
+Usage:
+    python -m georgian_hyphenation.minimize exceptions.json -o minimized.json
+    python -m georgian_hyphenation.minimize --default --report report.json
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional
+
+from .hyphenator import GeorgianHyphenator
+
+
+def build_report(hyphenator: GeorgianHyphenator,
+                 data: Optional[Dict[str, str]] = None) -> Dict[str, object]:
+    """
+    Build a minimization report for a dictionary
+
+    Args:
+        hyphenator: Configured hyphenator (clusters, left/right min)
+        data: Dictionary to check (default: the hyphenator's dictionary)
+
+    Returns:
+        Report with 'total', 'redundant' (list of words), 'disagreements'
+        (word -> explain_exception() records), 'branches' (branch -> number
+        of disagreeing offsets) and 'cluster_suggestions'
+    """
+    if data is None:
+        data = hyphenator.dictionary
+
+    redundant = []
+    disagreements = {}
+    branches: Dict[str, int] = {}
+    for word, hyphenated in data.items():
+        records = hyphenator.explain_exception(word, hyphenated)
+        if not records:
+            redundant.append(word)
+            continue
+        disagreements[word] = records
+        for record in records:
+            branch = record['branch']
+            branches[branch] = branches.get(branch, 0) + 1
+
+    return {
+        'settings': {
+            'left_min': hyphenator.left_min,
+            'right_min': hyphenator.right_min,
+            'harmonic_clusters': hyphenator.get_harmonic_clusters(),
+        },
+        'total': len(data),
+        'redundant': sorted(redundant),
+        'disagreements': disagreements,
+        'branches': dict(sorted(branches.items(), key=lambda item: -item[1])),
+        'cluster_suggestions': hyphenator.suggest_harmonic_clusters(data),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(
+        prog='python -m georgian_hyphenation.minimize',
+        description='Prune dictionary entries the algorithm already gets right.')
+    parser.add_argument('input', nargs='?',
+                        help='dictionary JSON file (word -> "hy-phe-na-ted")')
+    parser.add_argument('--default', action='store_true',
+                        help='check the bundled exceptions dictionary')
+    parser.add_argument('-o', '--output',
+                        help='write the minimized dictionary to this file')
+    parser.add_argument('--report',
+                        help='write the full JSON report to this file')
+    parser.add_argument('--left-min', type=int, default=2)
+    parser.add_argument('--right-min', type=int, default=2)
+    parser.add_argument('--add-cluster', action='append', default=[],
+                        metavar='CLUSTER',
+                        help='extra harmonic cluster (repeatable)')
+    args = parser.parse_args(argv)
+
+    if not args.input and not args.default:
+        parser.error('give a dictionary file or --default')
+
+    h = (GeorgianHyphenator('-')
+         .set_left_min(args.left_min)
+         .set_right_min(args.right_min))
+    for cluster in args.add_cluster:
+        h.add_harmonic_cluster(cluster)
+
+    if args.default:
+        h.load_default_library()
+        data = h.export_dictionary()
+    else:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+    report = build_report(h, data)
+
+    print(f"{len(report['redundant'])} of {report['total']} entries are redundant")
+    for branch, count in report['branches'].items():
+        print(f'  {branch}: {count} disagreeing break(s)')
+    for cluster, count in report['cluster_suggestions']:
+        print(f'  suggested cluster {cluster}: {count} entries')
+
+    if args.output:
+        redundant = set(report['redundant'])
+        minimized = {word: hyphenated for word, hyphenated in data.items()
+                     if word not in redundant}
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(minimized, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+            f.write('\n')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
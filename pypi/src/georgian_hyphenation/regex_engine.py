@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Regex-compiled hyphenation engine
+რეგულარულ გამოსახულებებზე დაფუძნებული ძრავა
+
+Compiles the hyphenator's current rule set (vowels, harmonic clusters,
+left/right minimums, dictionary) into precompiled regular expressions, so
+a whole text is hyphenated by one ``finditer`` pass that runs inside the C
+regex core instead of a Python loop per vowel pair.
+
+Every rule alternative matches from the first vowel of a pair up to the
+break point, so ``match.end()`` is the break offset:
+
+    V-V                V | V
+    V-C-V              V | C V
+    gemination         V C..X | X C.. V     (first doubled consonant)
+    harmonic cluster   V C.. | K V          (K = last two consonants)
+    default            V C | C.. V
+
+The anti-orphan guards are fixed-width lookarounds at the break. Rules that
+apply to a pair are made mutually exclusive with lookaheads, so a pair whose
+break is rejected by a guard yields no match at all (as in apply_algorithm)
+rather than falling through to a later rule.
+
+The rule expression is rebuilt only when the vowels, clusters or left/right
+minimums change, and the dictionary expression only when the dictionary
+contents change (the hyphen character is applied when joining).
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+_LETTER = '[ა-ჰ]'
+_LETTERS = ''.join(chr(code) for code in range(ord('ა'), ord('ჰ') + 1))
+
+
+class RegexEngine:
+    """
+    Regex-compiled equivalent of GeorgianHyphenator.hyphenate_text()
+
+    Produces the same output as the default engine for every text: each
+    Georgian word of 4+ letters uses the dictionary if present, otherwise
+    the algorithm.
+    """
+
+    def __init__(self):
+        # Content each expression was built from
+        self._rules_key: Optional[tuple] = None
+        self._words_key: Optional[str] = None
+        self._rules = None
+        self._words = None
+
+    def _compile(self, h) -> None:
+        """Regenerate the expressions whose inputs in h changed"""
+        rules_key = (h.vowels, tuple(sorted(h.harmonic_clusters)), h.left_min, h.right_min)
+        if rules_key != self._rules_key:
+            self._rules = re.compile(build_rule_pattern(*rules_key))
+            self._rules_key = rules_key
+
+        words_key = h._dictionary_fingerprint()
+        if words_key != self._words_key:
+            self._words = _compile_dictionary(h.dictionary)
+            self._words_key = words_key
+
+    def break_points(self, hyphenator, text: str) -> List[int]:
+        """
+        Get algorithm break offsets for a text (dictionary not applied)
+
+        Args:
+            hyphenator: GeorgianHyphenator whose rules apply
+            text: Sanitized text
+
+        Returns:
+            Ascending break offsets
+        """
+        self._compile(hyphenator)
+        return [match.end() for match in self._rules.finditer(text)]
+
+    def hyphenate_text(self, hyphenator, text: str) -> str:
+        """
+        Hyphenate an entire text in one regex pass
+
+        Args:
+            hyphenator: GeorgianHyphenator whose rules and dictionary apply
+                        (the engine keeps no reference, so copies of a
+                        hyphenator can share it)
+            text: Text to hyphenate
+
+        Returns:
+            Hyphenated text
+        """
+        if not text:
+            return ''
+        h = hyphenator
+        self._compile(h)
+        sanitized = h._strip_hyphens(text)
+
+        if self._words is None:
+            return self._join(sanitized, h.hyphen_char)
+
+        # Dictionary words come out at odd indices
+        parts = self._words.split(sanitized)
+        dictionary = h.dictionary
+        for i in range(1, len(parts), 2):
+            parts[i] = dictionary[parts[i]].replace('-', h.hyphen_char)
+        for i in range(0, len(parts), 2):
+            if parts[i]:
+                parts[i] = self._join(parts[i], h.hyphen_char)
+        return ''.join(parts)
+
+    def _join(self, text: str, hyphen_char: str) -> str:
+        breaks = [match.end() for match in self._rules.finditer(text)]
+        if not breaks:
+            return text
+        pieces = [text[start:end] for start, end in zip([0] + breaks, breaks + [len(text)])]
+        return hyphen_char.join(pieces)
+
+
+def build_rule_pattern(vowels: str, clusters: Iterable[str],
+                       left_min: int, right_min: int) -> str:
+    """
+    Build the rule expression for one configuration
+
+    Args:
+        vowels: Vowel letters
+        clusters: Harmonic clusters (two consonants each)
+        left_min: Minimum letters before a break
+        right_min: Minimum letters after a break
+
+    Returns:
+        Pattern whose matches end exactly at break offsets
+    """
+    consonants = ''.join(ch for ch in _LETTERS if ch not in vowels)
+    V = '[%s]' % re.escape(vowels)
+    C = '[%s]' % re.escape(consonants)
+
+    # hyphenate_text() only touches words of 4+ letters; apply_algorithm()
+    # needs left_min letters before and right_min after the break
+    guards = []
+    for before in range(left_min, max(left_min, 4 - right_min) + 1):
+        after = max(right_min, 4 - before)
+        guards.append('(?<=%s{%d})(?=%s{%d})' % (_LETTER, before, _LETTER, after))
+    G = guards[0] if len(guards) == 1 else '(?:%s)' % '|'.join(guards)
+
+    usable = [c for c in clusters
+              if len(c) == 2 and c[0] in consonants and c[1] in consonants]
+    K = _trie_pattern(usable) if usable else None
+
+    def no_doubling(name):
+        # The whole consonant run up to the next vowel has no doubled letter
+        return '(?=(?:(?P<%s>%s)(?!(?P=%s)))+%s)' % (name, C, name, V)
+
+    # Runs of two or more consonants; the alternatives are mutually
+    # exclusive, so they are ordered by cost, not by rule priority
+    complex_rules = []
+    if K:
+        # Default: break after the first consonant
+        complex_rules.append('%s(?!%s*%s%s)%s%s(?=%s+%s)' % (
+            no_doubling('n1'), C, K, V, C, G, C, V))
+        # Harmonic cluster: break before the last two consonants
+        complex_rules.append('%s%s*%s(?=%s%s)' % (no_doubling('n2'), C, G, K, V))
+    else:
+        complex_rules.append('%s%s%s(?=%s+%s)' % (no_doubling('n1'), C, G, C, V))
+    # Gemination: break inside the first doubled consonant
+    complex_rules.append('(?:(?P<g1>%s)(?!(?P=g1)))*(?P<g2>%s)%s(?=(?P=g2)%s*%s)' % (
+        C, C, G, C, V))
+
+    # Every rule starts at the first vowel of the pair; keeping that vowel
+    # outside the alternation gives the regex core a first-character set
+    # to scan for
+    return '%s(?:%s(?=%s%s)|%s(?=%s)|(?=%s%s)(?:%s))' % (
+        V,
+        G, C, V,        # V-C-V
+        G, V,           # V-V
+        C, C, '|'.join(complex_rules))
+
+
+def _compile_dictionary(dictionary: Dict[str, str]):
+    """Whole-word expression for dictionary keys hyphenate_text() can hit"""
+    words = [word for word in dictionary
+             if len(word) >= 4 and all('ა' <= ch <= 'ჰ' for ch in word)]
+    if not words:
+        return None
+    return re.compile('(?<!%s)(%s)(?!%s)' % (_LETTER, _trie_pattern(words), _LETTER))
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Alternation factored by common prefixes (linear-time matching)"""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+
+    def build(node):
+        ends = '' in node
+        # Children that only end a word collapse into one character class
+        leaves = ''.join(re.escape(ch) for ch, child in sorted(node.items())
+                         if ch and list(child) == [''])
+        branches = [re.escape(ch) + build(child)
+                    for ch, child in sorted(node.items())
+                    if ch and list(child) != ['']]
+        if len(leaves) > 1:
+            branches.append('[%s]' % leaves)
+        elif leaves:
+            branches.append(leaves)
+        if not branches:
+            return ''
+        if len(branches) == 1 and not ends:
+            return branches[0]
+        return '(?:%s)%s' % ('|'.join(branches), '?' if ends else '')
+
+    return build(trie)
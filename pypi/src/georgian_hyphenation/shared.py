@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+Shared-memory dictionary and cluster tables
+საერთო მეხსიერების ლექსიკონი
+
+Publishes a hyphenator's dictionary and harmonic clusters once, in a flat
+sorted binary layout, into ``multiprocessing.shared_memory`` (Python 3.8+)
+or a memory-mapped file. Worker processes attach with zero copy: lookups
+binary-search the shared buffer, so no per-entry Python objects (and no
+refcount-dirtied copy-on-write pages) exist in the workers.
+
+Layout (native byte order):
+    header   magic, version, entry count, cluster bytes, dictionary digest
+             (the dictionary part of config_fingerprint())
+    prefixes uint64 per entry: first 8 characters packed one byte each
+             (Georgian letters keep their order; any other character
+             ends the prefix, see _prefix), so a C-level bisect finds
+             the entry before any key is compared
+    index    4 x uint32 per entry (key offset/length, value offset/length),
+             sorted by UTF-8 key bytes
+    clusters UTF-8, newline separated
+    blob     UTF-8 keys and values
+
+Lifecycle:
+    # parent
+    tables = SharedTables.create(hyphenator)          # or create_file(h, path)
+    ...start workers with tables.name...
+    tables.close(); tables.unlink()
+
+    # worker
+    tables = SharedTables.attach(name)                # or attach_file(path)
+    h = GeorgianHyphenator().use_shared_tables(tables)
+    ...
+    tables.close()
+"""
+
+import mmap
+import os
+import re
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Iterator, Optional, Set
+
+from .hyphenator import _dictionary_digest
+
+_MAGIC = b'GHYT'
+_VERSION = 3
+_HEADER = struct.Struct('=4sIII16s')
+_FIELDS = 4
+
+
+class _PrefixTable(dict):
+    """str.translate table: one order-preserving byte per character"""
+
+    def __missing__(self, code: int) -> int:
+        return 1 if code < 0x10D0 else 255
+
+
+# Georgian letters (U+10D0..U+10FF) -> 2..49; 0 is reserved for padding
+_PREFIX_TABLE = _PrefixTable((code, code - 0x10D0 + 2) for code in range(0x10D0, 0x1100))
+# Bytes that stand for more than one character
+_COLLAPSED = re.compile(b'[\x01\xff]')
+
+
+class SharedTables(Mapping):
+    """
+    Read-only dictionary view over a shared, sorted binary table
+
+    Behaves like the ``dictionary`` attribute of GeorgianHyphenator
+    (``word in tables``, ``tables[word]``), plus ``clusters``.
+    """
+
+    def __init__(self, buf, shm=None, mm=None, owner: bool = False):
+        self._shm = shm
+        self._mm = mm
+        self._owner = owner
+        self._buf = memoryview(buf)
+
+        magic, version, count, clusters_size, fingerprint = \
+            _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self._buf.release()
+            raise ValueError('not a shared hyphenation table (or wrong version)')
+
+        self._count = count
+        prefixes_end = _HEADER.size + 8 * count
+        index_end = prefixes_end + 4 * _FIELDS * count
+        self._prefixes = self._buf[_HEADER.size:prefixes_end].cast('Q')
+        self._index = self._buf[prefixes_end:index_end].cast('I')
+        self._blob = self._buf[index_end + clusters_size:]
+        self.fingerprint = fingerprint.decode('ascii').rstrip('\0')
+
+        clusters = bytes(self._buf[index_end:index_end + clusters_size]).decode('utf-8')
+        self.clusters: Set[str] = set(clusters.split('\n')) if clusters else set()
+
+    # ========================================
+    # LIFECYCLE
+    # ========================================
+
+    @classmethod
+    def create(cls, hyphenator, name: Optional[str] = None) -> 'SharedTables':
+        """
+        Publish a hyphenator's tables into a new shared memory block
+
+        Args:
+            hyphenator: GeorgianHyphenator whose dictionary/clusters to publish
+            name: Shared memory name (default: generated, see ``name``)
+
+        Returns:
+            Owning SharedTables; call close() and unlink() when done
+        """
+        from multiprocessing import shared_memory
+        payload = _pack(hyphenator)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=len(payload))
+        shm.buf[:len(payload)] = payload
+        return cls(shm.buf, shm=shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedTables':
+        """
+        Attach to tables published with create()
+
+        Args:
+            name: Shared memory name (``tables.name`` in the parent)
+
+        Returns:
+            SharedTables; call close() when done
+        """
+        from multiprocessing import shared_memory
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13 registers every attach with the resource
+            # tracker, which unlinks the block when a worker's tracker
+            # exits (or trips over the owner's registration). Attaching
+            # must never take ownership, so skip the registration.
+            from multiprocessing import resource_tracker
+            register = resource_tracker.register
+            resource_tracker.register = lambda *args, **kwargs: None
+            try:
+                shm = shared_memory.SharedMemory(name=name)
+            finally:
+                resource_tracker.register = register
+        return cls(shm.buf, shm=shm)
+
+    @classmethod
+    def create_file(cls, hyphenator, path: str) -> 'SharedTables':
+        """
+        Publish a hyphenator's tables into a file and map it
+
+        Args:
+            hyphenator: GeorgianHyphenator whose dictionary/clusters to publish
+            path: File to write (replaced if it exists)
+
+        Returns:
+            Owning SharedTables; unlink() removes the file
+        """
+        payload = _pack(hyphenator)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        tables = cls.attach_file(path)
+        tables._owner = True
+        return tables
+
+    @classmethod
+    def attach_file(cls, path: str) -> 'SharedTables':
+        """
+        Map tables published with create_file()
+
+        Args:
+            path: Table file
+
+        Returns:
+            SharedTables; call close() when done
+        """
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        tables = cls(mm, mm=mm)
+        tables._path = path
+        return tables
+
+    @property
+    def name(self) -> Optional[str]:
+        """Shared memory name (or file path) workers attach to"""
+        if self._shm is not None:
+            return self._shm.name
+        return getattr(self, '_path', None)
+
+    def close(self) -> None:
+        """Detach from the shared buffer (the data stays published)"""
+        if self._buf is None:
+            return
+        self._prefixes.release()
+        self._index.release()
+        self._blob.release()
+        self._buf.release()
+        self._buf = None
+        if self._shm is not None:
+            self._shm.close()
+        if self._mm is not None:
+            self._mm.close()
+
+    def unlink(self) -> None:
+        """Remove the published data (owner only, after close())"""
+        if not self._owner:
+            raise ValueError('only the creating process can unlink shared tables')
+        if self._shm is not None:
+            self._shm.unlink()
+        elif self.name and os.path.exists(self.name):
+            os.remove(self.name)
+
+    def __del__(self):
+        # Views must be released before the underlying block can close
+        if getattr(self, '_buf', None) is not None:
+            self.close()
+
+    def __reduce__(self):
+        # Pickling (e.g. a hyphenator sent to a worker) re-attaches by name
+        if self._shm is not None:
+            return SharedTables.attach, (self.name,)
+        return SharedTables.attach_file, (self.name,)
+
+    def __enter__(self) -> 'SharedTables':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    # ========================================
+    # MAPPING
+    # ========================================
+
+    def _find(self, word: str) -> int:
+        """Binary search for word; returns its index slot or -1"""
+        prefix = _prefix(word)
+        prefixes = self._prefixes
+        slot = bisect_left(prefixes, prefix)
+        if slot == self._count or prefixes[slot] != prefix:
+            return -1
+
+        # Entries sharing all 8 prefix characters are adjacent; compare keys
+        key = word.encode('utf-8')
+        index = self._index
+        blob = self._blob
+        while slot < self._count and prefixes[slot] == prefix:
+            off = index[slot * _FIELDS]
+            if blob[off:off + index[slot * _FIELDS + 1]] == key:
+                return slot
+            slot += 1
+        return -1
+
+    def get(self, word, default=None):
+        slot = self._find(word) if isinstance(word, str) else -1
+        if slot < 0:
+            return default
+        off = self._index[slot * _FIELDS + 2]
+        return self._blob[off:off + self._index[slot * _FIELDS + 3]].tobytes().decode('utf-8')
+
+    def __getitem__(self, word: str) -> str:
+        value = self.get(word)
+        if value is None:
+            raise KeyError(word)
+        return value
+
+    def __contains__(self, word) -> bool:
+        return isinstance(word, str) and self._find(word) >= 0
+
+    def __iter__(self) -> Iterator[str]:
+        index = self._index
+        for slot in range(self._count):
+            off = index[slot * _FIELDS]
+            yield self._blob[off:off + index[slot * _FIELDS + 1]].tobytes().decode('utf-8')
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def _pack(hyphenator) -> bytes:
+    """Serialize dictionary and clusters into the shared table layout"""
+    # str order is code point order, i.e. the order of the UTF-8 bytes
+    entries = [(word.encode('utf-8'), hyphenated.encode('utf-8'))
+               for word, hyphenated in sorted(hyphenator.dictionary.items())]
+    clusters = '\n'.join(sorted(hyphenator.harmonic_clusters)).encode('utf-8')
+
+    prefixes = array('Q', (_prefix(word) for word in sorted(hyphenator.dictionary)))
+    if any(prefixes[i] > prefixes[i + 1] for i in range(len(prefixes) - 1)):
+        raise ValueError('dictionary keys do not sort by prefix')  # bisect would miss keys
+    index = array('I')
+    blob = bytearray()
+    for key, value in entries:
+        index.extend((len(blob), len(key), len(blob) + len(key), len(value)))
+        blob += key
+        blob += value
+
+    header = _HEADER.pack(_MAGIC, _VERSION, len(entries), len(clusters),
+                          _dictionary_digest(hyphenator.dictionary).encode('ascii'))
+    return header + prefixes.tobytes() + index.tobytes() + clusters + bytes(blob)
+
+
+def _prefix(word: str) -> int:
+    """First 8 characters of a word as an order-preserving integer"""
+    packed = word[:8].translate(_PREFIX_TABLE).encode('latin-1')
+    # Characters outside the Georgian block share bytes 1 and 255, so the
+    # characters after one of them would be compared out of order: stop
+    # the prefix there (keys sharing it are told apart by full comparison)
+    collapsed = _COLLAPSED.search(packed)
+    if collapsed:
+        packed = packed[:collapsed.end()]
+    return int.from_bytes(packed, 'big') << (8 * (8 - len(packed)))
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming corpus statistics
+კორპუსის სტატისტიკა
+
+Aggregates syllable-count histograms, syllable-type inventories and
+break-position distributions straight from break offsets, without ever
+building hyphenated strings. Partial results from different processes
+can be merged.
+
+Usage:
+    h = GeorgianHyphenator()
+    h.load_default_library()
+    stats = h.collect_statistics(open('corpus.txt', encoding='utf-8'))
+    print(stats.syllable_counts)
+"""
+
+import re
+from typing import Dict, Iterable, Optional
+
+_GEORGIAN_WORD = re.compile(r'[ა-ჰ]+')
+
+
+class CorpusStatistics:
+    """
+    Mergeable aggregate of hyphenation statistics over a corpus
+
+    Attributes:
+        words: Number of Georgian words seen
+        syllable_counts: Syllables per word -> number of words
+        syllable_types: Consonant/vowel shape (e.g. 'CVC') -> occurrences
+        break_positions: Break offset from word start -> occurrences
+        branches: Rule that produced a break ('dictionary' for dictionary
+                  entries, otherwise the algorithm branch) -> occurrences
+        dictionary_hits: Dictionary word -> number of occurrences
+        fingerprint: Configuration fingerprint the numbers were computed
+                     with (merging different configurations is refused)
+    """
+
+    def __init__(self, fingerprint: Optional[str] = None):
+        self.fingerprint = fingerprint
+        self.words = 0
+        self.syllable_counts: Dict[int, int] = {}
+        self.syllable_types: Dict[str, int] = {}
+        self.break_positions: Dict[int, int] = {}
+        self.branches: Dict[str, int] = {}
+        self.dictionary_hits: Dict[str, int] = {}
+
+    def update(self, hyphenator, text: str) -> 'CorpusStatistics':
+        """
+        Add every Georgian word of a text
+
+        Args:
+            hyphenator: GeorgianHyphenator providing rules and dictionary
+            text: Text to analyze
+
+        Returns:
+            Self for method chaining
+        """
+        self._check_fingerprint(hyphenator.config_fingerprint())
+        vowels = hyphenator.vowels
+        for match in _GEORGIAN_WORD.finditer(hyphenator._strip_hyphens(text)):
+            self._add_word(hyphenator, match.group(0), vowels)
+        return self
+
+    def update_stream(self, hyphenator, chunks: Iterable[str]) -> 'CorpusStatistics':
+        """
+        Add a text delivered in arbitrary chunks (e.g. file reads)
+
+        A word split across two chunks is counted once.
+
+        Args:
+            hyphenator: GeorgianHyphenator providing rules and dictionary
+            chunks: Iterable of text pieces (a file object works)
+
+        Returns:
+            Self for method chaining
+        """
+        # Breaks already in the text are part of the word they split
+        hyphen = hyphenator.hyphen_char if hyphenator.hyphen_char != '-' else ''
+        carry = ''
+        for chunk in chunks:
+            chunk = carry + chunk
+            # Hold back a trailing partial word until the next chunk
+            tail = len(chunk)
+            while tail > 0:
+                if 'ა' <= chunk[tail - 1] <= 'ჰ' or chunk[tail - 1] in '\u00AD\u200B':
+                    tail -= 1
+                elif hyphen and chunk.endswith(hyphen, 0, tail):
+                    tail -= len(hyphen)
+                else:
+                    break
+            carry = chunk[tail:]
+            if tail:
+                self.update(hyphenator, chunk[:tail])
+        if carry:
+            self.update(hyphenator, carry)
+        return self
+
+    def update_file(self, hyphenator, path: str, encoding: str = 'utf-8',
+                    chunk_size: int = 1 << 16) -> 'CorpusStatistics':
+        """
+        Add a text file, read in fixed-size chunks (constant memory)
+
+        Args:
+            hyphenator: GeorgianHyphenator providing rules and dictionary
+            path: File to read
+            encoding: File encoding
+            chunk_size: Characters per read
+
+        Returns:
+            Self for method chaining
+        """
+        with open(path, 'r', encoding=encoding) as f:
+            return self.update_stream(hyphenator, iter(lambda: f.read(chunk_size), ''))
+
+    def _add_word(self, hyphenator, word: str, vowels: str) -> None:
+        spelled, breaks, dictionary_hit = hyphenator._explain_breaks(word)
+
+        self.words += 1
+        _increment(self.syllable_counts, len(breaks) + 1)
+        if dictionary_hit:
+            _increment(self.dictionary_hits, word)
+
+        start = 0
+        for pos, branch in breaks:
+            _increment(self.break_positions, pos)
+            _increment(self.branches, branch)
+            _increment(self.syllable_types, _shape(spelled, start, pos, vowels))
+            start = pos
+        _increment(self.syllable_types, _shape(spelled, start, len(spelled), vowels))
+
+    def merge(self, other: 'CorpusStatistics') -> 'CorpusStatistics':
+        """
+        Add another partial result into this one
+
+        Args:
+            other: Statistics computed elsewhere (e.g. another process)
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            ValueError: If the two were computed with different configurations
+        """
+        self._check_fingerprint(other.fingerprint)
+        self.words += other.words
+        for name in ('syllable_counts', 'syllable_types', 'break_positions',
+                     'branches', 'dictionary_hits'):
+            target = getattr(self, name)
+            for key, count in getattr(other, name).items():
+                target[key] = target.get(key, 0) + count
+        return self
+
+    def __add__(self, other: 'CorpusStatistics') -> 'CorpusStatistics':
+        return CorpusStatistics.from_dict(self.to_dict()).merge(other)
+
+    def mean_syllables(self) -> float:
+        """
+        Get the average number of syllables per word
+
+        Returns:
+            Mean syllable count (0.0 for an empty corpus)
+        """
+        if not self.words:
+            return 0.0
+        total = sum(count * words for count, words in self.syllable_counts.items())
+        return total / self.words
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Export as plain JSON-serializable data
+
+        Returns:
+            Dictionary with all counters
+        """
+        return {
+            'fingerprint': self.fingerprint,
+            'words': self.words,
+            'syllable_counts': {str(k): v for k, v in self.syllable_counts.items()},
+            'syllable_types': dict(self.syllable_types),
+            'break_positions': {str(k): v for k, v in self.break_positions.items()},
+            'branches': dict(self.branches),
+            'dictionary_hits': dict(self.dictionary_hits),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> 'CorpusStatistics':
+        """
+        Rebuild statistics exported with to_dict()
+
+        Args:
+            data: Output of to_dict()
+
+        Returns:
+            New CorpusStatistics instance
+        """
+        stats = cls(data.get('fingerprint'))
+        stats.words = data.get('words', 0)
+        stats.syllable_counts = {int(k): v for k, v in data.get('syllable_counts', {}).items()}
+        stats.syllable_types = dict(data.get('syllable_types', {}))
+        stats.break_positions = {int(k): v for k, v in data.get('break_positions', {}).items()}
+        stats.branches = dict(data.get('branches', {}))
+        stats.dictionary_hits = dict(data.get('dictionary_hits', {}))
+        return stats
+
+    def _check_fingerprint(self, fingerprint: Optional[str]) -> None:
+        if fingerprint is None:
+            return
+        if self.fingerprint is None:
+            self.fingerprint = fingerprint
+        elif self.fingerprint != fingerprint:
+            raise ValueError(
+                'statistics were computed with a different hyphenator '
+                'configuration (%s != %s)' % (self.fingerprint, fingerprint))
+
+
+def _increment(counter: Dict, key) -> None:
+    counter[key] = counter.get(key, 0) + 1
+
+
+def _shape(word: str, start: int, end: int, vowels: str) -> str:
+    """Consonant/vowel shape of word[start:end], e.g. 'CVC'"""
+    return ''.join('V' if word[i] in vowels else 'C' for i in range(start, end))
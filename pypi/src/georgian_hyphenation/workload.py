@@ -0,0 +1,600 @@
+# -*- coding: utf-8 -*-
+"""
+Workload capture and replay
+დატვირთვის ჩაწერა და გამეორება
+
+An opt-in recorder samples calls to hyphenate(), hyphenate_text() and
+hyphenate_html() into a gzip-compressed binary log: call kind, input size,
+word count, duration and (depending on ``text_mode``) the input itself, plus
+a configuration record whenever the configuration changes. A replay re-runs
+the recorded inputs against any engine or configuration and reports
+throughput and latency percentiles.
+
+Text modes:
+    'plain'   the input text is stored
+    'hash'    each Georgian word is stored as a salted 32-bit hash and its
+              length; replay substitutes one pseudo-word per distinct hash,
+              so the word-frequency distribution and sizes are kept
+    'redact'  only word lengths are stored; every replayed word is unique
+
+In 'hash' and 'redact' modes the text around the words is kept as a
+skeleton: whitespace, punctuation and HTML tag names stay, other letters
+become 'x' and digits '0'. Replayed inputs therefore have the recorded
+markup and length, and hyphenate_html() skips the same elements.
+
+The compressed stream is flushed every ``flush_every`` records, so the log
+of a worker that dies without close() still loads up to the last flush.
+
+Usage:
+    recorder = WorkloadRecorder('traffic.ghwl', sample_rate=0.05, text_mode='hash')
+    h = GeorgianHyphenator().set_recorder(recorder)
+    ...
+    recorder.close()
+
+    python -m georgian_hyphenation.workload summary traffic.ghwl
+    python -m georgian_hyphenation.workload replay traffic.ghwl --engine regex
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import random
+import re
+import struct
+import sys
+import threading
+import time
+import zlib
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .hyphenator import GeorgianHyphenator
+
+_MAGIC = b'GHWL'
+_VERSION = 2
+_HEADER = struct.Struct('<4sBB')
+_CONFIG = struct.Struct('<BI')            # record type, JSON length
+_CALL = struct.Struct('<BBIIQI')          # record type, kind, chars, words, ns, payload
+
+_RECORD_CONFIG = 0
+_RECORD_CALL = 1
+
+_READ_SIZE = 1 << 16
+
+KINDS = ('hyphenate', 'hyphenate_text', 'hyphenate_html')
+TEXT_MODES = ('plain', 'hash', 'redact')
+
+_GEORGIAN_WORD = re.compile(r'[ა-ჰ]+')
+_TAG_NAME = re.compile(r'</?[A-Za-z][A-Za-z0-9-]*')
+_OTHER_LETTER = re.compile(r'[^\W\d_]')
+_DIGIT = re.compile(r'\d')
+# Stands for a Georgian word in a skeleton
+_WORD_MARK = '\x00'
+_CONSONANTS = 'ბგდვზთკლმნპჟრსტფქღყშჩცძწჭხჯჰ'
+_VOWELS = 'აეიოუ'
+
+
+class WorkloadRecorder:
+    """
+    Sampling recorder attached with GeorgianHyphenator.set_recorder()
+
+    Only outermost calls are recorded (hyphenate_html() calling
+    hyphenate_text() is one call). Safe to share between threads.
+    """
+
+    def __init__(self, path: str, sample_rate: float = 1.0,
+                 text_mode: str = 'plain', seed: Optional[int] = None,
+                 flush_every: int = 256):
+        """
+        Create a log file (replaced if it exists)
+
+        Args:
+            path: Log file to write
+            sample_rate: Fraction of calls to record (0.0 - 1.0)
+            text_mode: 'plain', 'hash' or 'redact' (see module docstring)
+            seed: Seed for the sampling decisions (default: random)
+            flush_every: Records between flushes of the compressed stream
+                         (at most this many are lost if the process dies)
+
+        Raises:
+            ValueError: If text_mode, sample_rate or flush_every is invalid
+        """
+        if text_mode not in TEXT_MODES:
+            raise ValueError('text_mode must be one of %s' % ', '.join(TEXT_MODES))
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError('sample_rate must be between 0.0 and 1.0')
+        if flush_every < 1:
+            raise ValueError('flush_every must be at least 1')
+        self.path = path
+        self.sample_rate = sample_rate
+        self.text_mode = text_mode
+        self.flush_every = flush_every
+        self.calls = 0
+        self.recorded = 0
+        # The salt never leaves this process: hashes only need to be
+        # consistent within one log, and cannot be reversed by lookup
+        self._salt = os.urandom(16)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._config_key: Optional[tuple] = None
+        self._unflushed = 0
+        self._file = gzip.open(path, 'wb')
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, TEXT_MODES.index(text_mode)))
+        self._file.flush(zlib.Z_SYNC_FLUSH)
+
+    def busy(self) -> bool:
+        """True while this thread is inside a call being dispatched"""
+        return getattr(self._local, 'depth', 0) > 0
+
+    def call(self, hyphenator, kind: str, method, value: str) -> str:
+        """
+        Run one hyphenator call, recording it if sampled
+
+        Args:
+            hyphenator: GeorgianHyphenator the call belongs to
+            kind: One of KINDS
+            method: Bound method to run
+            value: Its argument
+
+        Returns:
+            The method's result
+        """
+        with self._lock:
+            self.calls += 1
+            sampled = (self._file is not None and
+                       (self.sample_rate >= 1.0 or self._random.random() < self.sample_rate))
+
+        self._local.depth = getattr(self._local, 'depth', 0) + 1
+        try:
+            if not sampled:
+                return method(value)
+            start = time.perf_counter_ns()
+            result = method(value)
+            elapsed = time.perf_counter_ns() - start
+        finally:
+            self._local.depth -= 1
+
+        self._write_call(hyphenator, kind, value, elapsed)
+        return result
+
+    def _write_call(self, hyphenator, kind: str, value: str, elapsed: int) -> None:
+        words = _GEORGIAN_WORD.findall(value)
+        if self.text_mode == 'plain':
+            payload = value.encode('utf-8')
+        else:
+            lengths = bytes(min(len(word), 255) for word in words)
+            skeleton = _skeleton(value).encode('utf-8')
+            if self.text_mode == 'hash':
+                hashes = array('I', (_word_hash(word, self._salt) for word in words))
+                if sys.byteorder != 'little':
+                    hashes.byteswap()
+                payload = hashes.tobytes() + lengths + skeleton
+            else:
+                payload = lengths + skeleton
+
+        config_key = (hyphenator.config_fingerprint(), hyphenator._engine is not None)
+        with self._lock:
+            if self._file is None:
+                return
+            if config_key != self._config_key:
+                config = json.dumps(_describe_config(hyphenator),
+                                    ensure_ascii=False).encode('utf-8')
+                self._file.write(_CONFIG.pack(_RECORD_CONFIG, len(config)) + config)
+                self._config_key = config_key
+            self._file.write(_CALL.pack(_RECORD_CALL, KINDS.index(kind), len(value),
+                                        len(words), elapsed, len(payload)) + payload)
+            self.recorded += 1
+            self._unflushed += 1
+            if self._unflushed >= self.flush_every:
+                self._file.flush(zlib.Z_SYNC_FLUSH)
+                self._unflushed = 0
+
+    def flush(self) -> None:
+        """Write out every record so far (the log stays open)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush(zlib.Z_SYNC_FLUSH)
+                self._unflushed = 0
+
+    def close(self) -> None:
+        """Finish the log (further calls are no longer recorded)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> 'WorkloadRecorder':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class RecordedCall:
+    """One recorded call: kind, sizes, duration and replayable input"""
+
+    __slots__ = ('kind', 'chars', 'words', 'duration_ns', 'text', 'config')
+
+    def __init__(self, kind: str, chars: int, words: int, duration_ns: int,
+                 text: str, config: int):
+        self.kind = kind
+        self.chars = chars
+        self.words = words
+        self.duration_ns = duration_ns
+        self.text = text
+        self.config = config
+
+
+class Workload:
+    """
+    A loaded workload log
+
+    Attributes:
+        text_mode: Mode the log was recorded with
+        configs: Recorded configurations (see _describe_config)
+        calls: RecordedCall list; ``call.config`` indexes ``configs``
+        truncated: The log ended mid-stream (the recorder was not closed);
+                   ``calls`` holds the complete records before the cut
+    """
+
+    def __init__(self, text_mode: str, configs: List[Dict[str, object]],
+                 calls: List[RecordedCall], truncated: bool = False):
+        self.text_mode = text_mode
+        self.configs = configs
+        self.calls = calls
+        self.truncated = truncated
+
+    def word_frequencies(self) -> Dict[str, int]:
+        """
+        Get occurrences per distinct word (pseudo-words for hashed logs)
+
+        Returns:
+            Word -> number of occurrences
+        """
+        counts: Dict[str, int] = {}
+        for call in self.calls:
+            for word in _GEORGIAN_WORD.findall(call.text):
+                counts[word] = counts.get(word, 0) + 1
+        return counts
+
+    def summary(self) -> Dict[str, object]:
+        """
+        Describe the recorded traffic
+
+        Returns:
+            Dictionary with call/word/char totals, calls per kind, input
+            size percentiles, recorded latency percentiles, distinct
+            word count and whether the log was truncated
+        """
+        frequencies = self.word_frequencies()
+        by_kind: Dict[str, int] = {}
+        for call in self.calls:
+            by_kind[call.kind] = by_kind.get(call.kind, 0) + 1
+        return {
+            'text_mode': self.text_mode,
+            'truncated': self.truncated,
+            'configs': len(self.configs),
+            'calls': len(self.calls),
+            'calls_by_kind': by_kind,
+            'chars': sum(call.chars for call in self.calls),
+            'words': sum(call.words for call in self.calls),
+            'distinct_words': len(frequencies),
+            'input_chars': _percentiles([call.chars for call in self.calls]),
+            'recorded_latency_us': _percentiles(
+                [call.duration_ns / 1000 for call in self.calls]),
+        }
+
+
+def load_workload(path: str) -> Workload:
+    """
+    Read a log written by WorkloadRecorder
+
+    A log cut short (the recording process died before close()) loads up
+    to its last complete record and is marked ``truncated``.
+
+    Args:
+        path: Log file
+
+    Returns:
+        Workload with replayable inputs
+
+    Raises:
+        ValueError: If the file is not a workload log
+    """
+    data, truncated = _decompress(path)
+    if len(data) < _HEADER.size:
+        raise ValueError('not a workload log')
+    magic, version, mode = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC or version != _VERSION or mode >= len(TEXT_MODES):
+        raise ValueError('not a workload log (or wrong version)')
+    text_mode = TEXT_MODES[mode]
+
+    configs: List[Dict[str, object]] = []
+    calls: List[RecordedCall] = []
+    pos = _HEADER.size
+    while pos < len(data):
+        record = _CONFIG if data[pos] == _RECORD_CONFIG else _CALL
+        if pos + record.size > len(data):
+            truncated = True
+            break
+        fields = record.unpack_from(data, pos)
+        start = pos + record.size
+        end = start + fields[-1]
+        if end > len(data):
+            # Torn last record
+            truncated = True
+            break
+        pos = end
+        if record is _CONFIG:
+            configs.append(json.loads(data[start:end].decode('utf-8')))
+            continue
+        _, kind, chars, words, elapsed, _ = fields
+        text = _replay_text(text_mode, data[start:end], words, len(calls))
+        calls.append(RecordedCall(KINDS[kind], chars, words, elapsed, text,
+                                  len(configs) - 1))
+    return Workload(text_mode, configs, calls, truncated)
+
+
+def _decompress(path: str) -> Tuple[bytes, bool]:
+    """
+    Decompress a gzip file incrementally, keeping what precedes a cut
+
+    Returns:
+        Tuple of (data, truncated)
+    """
+    out = []
+    decompressor = zlib.decompressobj(wbits=31)
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(_READ_SIZE)
+            if not chunk:
+                return b''.join(out), not decompressor.eof
+            try:
+                while chunk:
+                    out.append(decompressor.decompress(chunk))
+                    # Concatenated gzip members continue with a new decompressor
+                    chunk = decompressor.unused_data if decompressor.eof else b''
+                    if chunk:
+                        decompressor = zlib.decompressobj(wbits=31)
+            except zlib.error:
+                # Damaged tail: keep what decoded before it
+                return b''.join(out), True
+
+
+def _replay_text(text_mode: str, payload: bytes, words: int, index: int) -> str:
+    """Input to replay for one call"""
+    if text_mode == 'plain':
+        return payload.decode('utf-8')
+    if text_mode == 'hash':
+        hashes = array('I')
+        hashes.frombytes(payload[:4 * words])
+        if sys.byteorder != 'little':
+            hashes.byteswap()
+        lengths = payload[4 * words:5 * words]
+        skeleton = payload[5 * words:]
+        pseudo = [_pseudo_word(seed, length) for seed, length in zip(hashes, lengths)]
+    else:
+        lengths = payload[:words]
+        skeleton = payload[words:]
+        pseudo = [_pseudo_word((index << 16) ^ i, length) for i, length in enumerate(lengths)]
+
+    # Put the pseudo-words back where the recorded words were
+    parts = skeleton.decode('utf-8').split(_WORD_MARK)
+    text = [parts[0]]
+    for word, part in zip(pseudo, parts[1:]):
+        text.append(word)
+        text.append(part)
+    return ''.join(text)
+
+
+def _skeleton(text: str) -> str:
+    """Text with Georgian words replaced by _WORD_MARK and other content masked"""
+    text = _GEORGIAN_WORD.sub(_WORD_MARK, text.replace(_WORD_MARK, ' '))
+    pieces = []
+    pos = 0
+    # Tag names stay: hyphenate_html() decides what to skip by them
+    for match in _TAG_NAME.finditer(text):
+        pieces.append(_DIGIT.sub('0', _OTHER_LETTER.sub('x', text[pos:match.start()])))
+        pieces.append(match.group(0))
+        pos = match.end()
+    pieces.append(_DIGIT.sub('0', _OTHER_LETTER.sub('x', text[pos:])))
+    return ''.join(pieces)
+
+
+def replay_workload(workload: Workload, hyphenator: GeorgianHyphenator,
+                    repeat: int = 1, recorded_config: bool = False) -> Dict[str, object]:
+    """
+    Re-run recorded calls and measure them
+
+    Args:
+        workload: Output of load_workload()
+        hyphenator: Hyphenator (engine, configuration, dictionary) to test
+        repeat: Number of passes over the log (latencies from all passes)
+        recorded_config: Apply each call's recorded hyphen_char, left/right
+                         min, clusters and engine before running it (the
+                         dictionary is never recorded; load it yourself)
+
+    Returns:
+        Report with totals, throughput ('calls_per_second',
+        'words_per_second', 'chars_per_second'), 'latency_us' percentiles
+        (overall and 'by_kind'), the recorded percentiles for comparison
+        and whether the configuration fingerprints matched
+    """
+    methods = {kind: getattr(hyphenator, kind) for kind in KINDS}
+    latencies: List[float] = []
+    by_kind: Dict[str, List[float]] = {}
+    fingerprints = set()
+    applied = None
+    total_ns = 0
+
+    for _ in range(repeat):
+        for call in workload.calls:
+            if recorded_config and call.config != applied and call.config >= 0:
+                _apply_config(hyphenator, workload.configs[call.config])
+                applied = call.config
+            if call.config >= 0:
+                recorded = workload.configs[call.config].get('fingerprint')
+                fingerprints.add(recorded == hyphenator.config_fingerprint())
+            method = methods[call.kind]
+            start = time.perf_counter_ns()
+            method(call.text)
+            elapsed = time.perf_counter_ns() - start
+            total_ns += elapsed
+            latencies.append(elapsed / 1000)
+            by_kind.setdefault(call.kind, []).append(elapsed / 1000)
+
+    seconds = total_ns / 1e9
+    calls = len(workload.calls) * repeat
+    words = sum(call.words for call in workload.calls) * repeat
+    chars = sum(len(call.text) for call in workload.calls) * repeat
+    return {
+        'calls': calls,
+        'words': words,
+        'chars': chars,
+        'seconds': seconds,
+        'calls_per_second': calls / seconds if seconds else 0.0,
+        'words_per_second': words / seconds if seconds else 0.0,
+        'chars_per_second': chars / seconds if seconds else 0.0,
+        'latency_us': _percentiles(latencies),
+        'by_kind': {kind: _percentiles(values) for kind, values in by_kind.items()},
+        'recorded_latency_us': _percentiles(
+            [call.duration_ns / 1000 for call in workload.calls]),
+        'fingerprint_match': fingerprints == {True},
+    }
+
+
+def _describe_config(hyphenator) -> Dict[str, object]:
+    return {
+        'fingerprint': hyphenator.config_fingerprint(),
+        'hyphen_char': hyphenator.hyphen_char,
+        'left_min': hyphenator.left_min,
+        'right_min': hyphenator.right_min,
+        'harmonic_clusters': sorted(hyphenator.harmonic_clusters),
+        'dictionary_size': len(hyphenator.dictionary),
+        'engine': 'default' if hyphenator._engine is None else 'regex',
+        'recorded_at': time.time(),
+    }
+
+
+def _apply_config(hyphenator, config: Dict[str, object]) -> None:
+    hyphenator.set_hyphen_char(config['hyphen_char'])
+    hyphenator.set_left_min(config['left_min'])
+    hyphenator.set_right_min(config['right_min'])
+    for cluster in hyphenator.get_harmonic_clusters():
+        if cluster not in config['harmonic_clusters']:
+            hyphenator.remove_harmonic_cluster(cluster)
+    for cluster in config['harmonic_clusters']:
+        hyphenator.add_harmonic_cluster(cluster)
+    hyphenator.set_engine(config.get('engine', 'default'))
+
+
+def _word_hash(word: str, salt: bytes) -> int:
+    digest = hashlib.blake2b(word.encode('utf-8'), digest_size=4, key=salt).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def _pseudo_word(seed: int, length: int) -> str:
+    """Deterministic Georgian-shaped word (consonant/vowel alternation)"""
+    rng = random.Random(seed)
+    letters = []
+    for i in range(length):
+        vowel = rng.random() < (0.7 if i % 2 else 0.3)
+        letters.append(rng.choice(_VOWELS if vowel else _CONSONANTS))
+    return ''.join(letters)
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    """Nearest-rank p50/p90/p99 and max"""
+    if not values:
+        return {'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0}
+    ordered = sorted(values)
+
+    def rank(p):
+        return ordered[min(len(ordered) - 1, max(0, -(-p * len(ordered) // 100) - 1))]
+
+    return {'p50': rank(50), 'p90': rank(90), 'p99': rank(99), 'max': ordered[-1]}
+
+
+def _report_lines(report: Dict[str, object]) -> Iterator[str]:
+    for key in ('calls', 'words', 'chars', 'distinct_words', 'seconds',
+                'calls_per_second', 'words_per_second', 'chars_per_second'):
+        if key in report:
+            value = report[key]
+            yield f'{key:<20} {value:,.0f}' if isinstance(value, int) or value > 100 \
+                else f'{key:<20} {value:.3f}'
+    for key in ('input_chars', 'latency_us', 'recorded_latency_us'):
+        if key in report:
+            values = ' '.join(f'{name}={value:.1f}' for name, value in report[key].items())
+            yield f'{key:<20} {values}'
+    for kind, values in report.get('by_kind', {}).items():
+        yield f'  {kind:<18} ' + ' '.join(f'{name}={value:.1f}' for name, value in values.items())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(
+        prog='python -m georgian_hyphenation.workload',
+        description='Inspect or replay a recorded hyphenation workload.')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    summary = sub.add_parser('summary', help='describe the recorded traffic')
+    summary.add_argument('log')
+    summary.add_argument('--json', action='store_true', help='print the summary as JSON')
+
+    replay = sub.add_parser('replay', help='re-run the log and measure it')
+    replay.add_argument('log')
+    replay.add_argument('--engine', choices=('default', 'regex'), default='default')
+    replay.add_argument('--dictionary',
+                        help='dictionary JSON file (default: bundled dictionary)')
+    replay.add_argument('--no-dictionary', action='store_true')
+    replay.add_argument('--recorded-config', action='store_true',
+                        help='apply the recorded hyphen char, minimums, clusters '
+                             'and engine (overrides the options below)')
+    replay.add_argument('--left-min', type=int, default=2)
+    replay.add_argument('--right-min', type=int, default=2)
+    replay.add_argument('--add-cluster', action='append', default=[],
+                        metavar='CLUSTER',
+                        help='extra harmonic cluster (repeatable)')
+    replay.add_argument('--repeat', type=int, default=1)
+    replay.add_argument('--json', action='store_true', help='print the report as JSON')
+
+    args = parser.parse_args(argv)
+    workload = load_workload(args.log)
+
+    if args.command == 'summary':
+        report = workload.summary()
+        print(f"{args.log}: {report['text_mode']} text, {report['configs']} configuration(s)")
+        if report['truncated']:
+            print('  truncated: the recorder was not closed; complete records loaded')
+        for kind, count in report['calls_by_kind'].items():
+            print(f'  {kind}: {count} call(s)')
+    else:
+        h = (GeorgianHyphenator()
+             .set_left_min(args.left_min)
+             .set_right_min(args.right_min)
+             .set_engine(args.engine))
+        for cluster in args.add_cluster:
+            h.add_harmonic_cluster(cluster)
+        if args.dictionary:
+            with open(args.dictionary, 'r', encoding='utf-8') as f:
+                h.load_library(json.load(f))
+        elif not args.no_dictionary:
+            h.load_default_library()
+        report = replay_workload(workload, h, repeat=args.repeat,
+                                 recorded_config=args.recorded_config)
+        if not report['fingerprint_match']:
+            print('note: configuration differs from the recorded one')
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        for line in _report_lines(report):
+            print(line)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
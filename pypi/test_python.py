@@ -5,6 +5,7 @@ Tests all functions including 17 new utility functions
 """
 
 import os
+import re
 import sys
 
 # Import from the package (adjust path if testing locally)
@@ -229,6 +230,709 @@ def test_regressions():
         print('ok - npm and pypi dictionary copies are in sync')
 
 
+def test_dictionary_minimizer():
+    """Dictionary entries the algorithm reproduces are found and pruned"""
+    print_section('11. DICTIONARY MINIMIZER')
+
+    h = GeorgianHyphenator('-')
+    data = {
+        'იუთუბი': 'იუ-თუ-ბი',               # algorithm agrees
+        'კომპიუტერი': 'კომ-პიუ-ტე-რი',      # V-V split differs
+        'ინსტაგრამი': 'ინს-ტაგ-რა-მი',      # default/cluster splits differ
+    }
+
+    assert h.find_redundant_exceptions(data) == ['იუთუბი']
+    assert h.minimize_dictionary(data) == {
+        'კომპიუტერი': 'კომ-პიუ-ტე-რი',
+        'ინსტაგრამი': 'ინს-ტაგ-რა-მი',
+    }
+    print('ok - redundant entries detected')
+
+    records = h.explain_exception('კომპიუტერი', 'კომ-პიუ-ტე-რი')
+    assert records == [{'position': 5, 'dictionary': False,
+                        'branch': 'vowel-vowel', 'rejected_by': None}]
+    print('ok - disagreeing branch reported')
+
+    # A dictionary break kept together as an onset suggests a new cluster
+    assert h.suggest_harmonic_clusters({'ბასტა': 'ბა-სტა'}) == [('სტ', 1)]
+    h.add_harmonic_cluster('სტ')
+    assert h.find_redundant_exceptions({'ბასტა': 'ბა-სტა'}) == ['ბასტა']
+    print('ok - cluster suggestion makes entry redundant')
+
+    pruned = GeorgianHyphenator('-')
+    pruned.load_library(data, prune=True)
+    assert 'იუთუბი' not in pruned.dictionary
+    assert pruned.hyphenate('იუთუბი') == 'იუ-თუ-ბი'
+    assert pruned.get_dictionary_size() == 2
+    print('ok - prune on load')
+
+    # A pruned override still replaces an existing entry
+    overridden = GeorgianHyphenator('-')
+    overridden.load_default_library()
+    algorithm = overridden.apply_algorithm('კომპიუტერი')
+    assert overridden.hyphenate('კომპიუტერი') != algorithm
+    overridden.load_library({'კომპიუტერი': algorithm}, prune=True)
+    assert 'კომპიუტერი' not in overridden.dictionary
+    assert overridden.hyphenate('კომპიუტერი') == algorithm
+    print('ok - prune removes stale entries it overrides')
+
+
+def test_persistent_cache():
+    """Cached break positions survive a restart and never go stale"""
+    print_section('12. PERSISTENT CACHE')
+
+    import tempfile
+    from georgian_hyphenation import PersistentCache
+
+    words = ['საქართველო', 'კომპიუტერი,', 'გამარჯობა', 'მაგ-რამ', 'ენა']
+    plain = GeorgianHyphenator('-')
+    plain.load_default_library()
+    expected = [plain.hyphenate(w) for w in words]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite3')
+
+        with PersistentCache(path) as cache:
+            h = GeorgianHyphenator('-').set_cache(cache)
+            h.load_default_library()
+            assert [h.hyphenate(w) for w in words] == expected
+            assert [h.hyphenate(w) for w in words] == expected
+            assert cache.hits == len(words)
+        print('ok - cached results match the uncached engine')
+
+        # "Restarted worker": same configuration warms up from disk
+        with PersistentCache(path) as cache:
+            h = GeorgianHyphenator('-')
+            h.load_default_library()
+            h.set_cache(cache, preload=100)
+            assert [h.hyphenate(w) for w in words] == expected
+            assert cache.misses == 0
+            print('ok - warm start serves every word from the cache')
+
+            # A configuration change must not reuse old entries
+            h.set_left_min(4)
+            assert h.hyphenate('გამარჯობა') == 'გამარ-ჯო-ბა'
+            assert cache.misses == 1
+            print('ok - fingerprint change invalidates entries')
+
+        with PersistentCache(path, max_entries=3, batch_size=1) as cache:
+            h = GeorgianHyphenator('-').set_cache(cache)
+            h.hyphenate_words(words)
+            assert cache.size() <= 3
+        print('ok - size cap enforced')
+
+        # Threads share one cache and one hyphenator; the irregular
+        # dictionary entry ('შარები' -> 'შე-რე-ბი') is never cached
+        import threading
+        words = ['შარები', '(შარები)', 'საქართველო', 'კომპიუტერი,']
+        expected = [plain.hyphenate(w) for w in words]
+        with PersistentCache(path) as cache:
+            shared = GeorgianHyphenator('-').set_cache(cache)
+            shared.load_default_library()
+            errors = []
+
+            def work():
+                try:
+                    for _ in range(20000):
+                        assert [shared.hyphenate(w) for w in words] == expected
+                except Exception as e:  # pragma: no cover - reported below
+                    errors.append(e)
+
+            interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-5)
+            try:
+                threads = [threading.Thread(target=work) for _ in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+            finally:
+                sys.setswitchinterval(interval)
+            assert not errors, errors[0]
+            assert shared._cache is cache
+        print('ok - cache shared by threads')
+
+
+def test_corpus_statistics():
+    """Streaming statistics agree with the per-word string APIs"""
+    print_section('13. CORPUS STATISTICS')
+
+    import re
+    from georgian_hyphenation import CorpusStatistics
+
+    h = GeorgianHyphenator('-')
+    h.load_default_library()
+    text = ('საქართველო არის ლამაზი ქვეყანა. კომპიუტერი, გამარჯობა და '
+            'მოგზაურობა — უნივერსიტეტი ენა!')
+    words = re.findall(r'[ა-ჰ]+', text)
+
+    stats = h.collect_statistics([text])
+    expected = {}
+    for word in words:
+        n = h.count_syllables(word)
+        expected[n] = expected.get(n, 0) + 1
+    assert stats.words == len(words)
+    assert stats.syllable_counts == expected
+    assert sum(stats.branches.values()) == sum(
+        h.get_hyphenation_points(w) for w in words)
+    assert stats.dictionary_hits == {w: 1 for w in words if w in h.dictionary}
+    print('ok - histogram matches count_syllables()')
+
+    # Chunked input splitting words mid-way gives the same numbers
+    chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+    streamed = CorpusStatistics().update_stream(h, chunks)
+    assert streamed.to_dict() == stats.to_dict()
+    print('ok - chunked stream counts each word once')
+
+    # Already hyphenated text: breaks inside a word do not split it
+    hyphenated = h.hyphenate_text(text).replace('-', '\u00AD')
+    for size in (1, 2, 5, len(hyphenated)):
+        chunks = [hyphenated[i:i + size] for i in range(0, len(hyphenated), size)]
+        assert CorpusStatistics().update_stream(h, chunks).to_dict() == stats.to_dict(), size
+    marked = h.hyphenate_text(text)
+    chunks = [marked[i:i + 3] for i in range(0, len(marked), 3)]
+    hy = GeorgianHyphenator('|')
+    assert CorpusStatistics().update_stream(hy, [c.replace('-', '|') for c in chunks]).words == len(words)
+    print('ok - soft-hyphenated stream counts each word once')
+
+    # Partial results merge like a single pass
+    half = len(words) // 2
+    left = h.collect_statistics([' '.join(words[:half])])
+    right = h.collect_statistics([' '.join(words[half:])])
+    merged = CorpusStatistics.from_dict(left.to_dict()).merge(right)
+    assert merged.to_dict() == stats.to_dict()
+    print('ok - partial results merge')
+
+    other = GeorgianHyphenator('-').set_left_min(3)
+    try:
+        stats.merge(other.collect_statistics([text]))
+        assert False, 'merging different configurations must fail'
+    except ValueError:
+        print('ok - different configurations refuse to merge')
+
+
+def test_document_pipeline():
+    """DOCX/EPUB members are streamed; only prose text nodes change"""
+    print_section('14. DOCUMENT PIPELINE')
+
+    import io
+    import tempfile
+    import zipfile
+    from georgian_hyphenation.documents import rewrite_xml
+
+    h = GeorgianHyphenator()
+    h.load_default_library()
+
+    # Tiny chunks split words and tags mid-way; output must not change
+    xhtml = ('<?xml version="1.0" encoding="utf-8"?><html><head>'
+             '<title>საქართველო</title></head><body><p class="x">'
+             'გამარჯობა &amp; საქართველო</p><code>საქართველო</code>'
+             '<!-- საქართველო --><br/></body></html>')
+    expected = xhtml.replace(
+        '<p class="x">გამარჯობა &amp; საქართველო',
+        '<p class="x">' + h.hyphenate_text('გამარჯობა & საქართველო')
+        .replace('&', '&amp;'))
+    for chunk_size in (5, 7, 1 << 16):
+        out = io.BytesIO()
+        rewrite_xml(h, 'epub', io.BytesIO(xhtml.encode('utf-8')), out, chunk_size)
+        assert out.getvalue().decode('utf-8') == expected, chunk_size
+
+    # '>' inside a comment, CDATA or PI cut by a chunk boundary
+    tricky = ('<html><body><p>ა<!-- a > b საქართველო --></p>'
+              '<![CDATA[ x > საქართველო ]]><?pi a > საქართველო ?></body></html>')
+    for chunk_size in list(range(1, 31)) + [1 << 16]:
+        out = io.BytesIO()
+        rewrite_xml(h, 'epub', io.BytesIO(tricky.encode('utf-8')), out, chunk_size)
+        assert out.getvalue().decode('utf-8') == tricky, chunk_size
+    print('ok - XHTML text nodes hyphenated, skip tags untouched')
+
+    # ODT always gets U+00AD, whatever the hyphenator's hyphen_char
+    visible = GeorgianHyphenator('-')
+    odt = '<office:text><text:p>საქართველო</text:p></office:text>'
+    out = io.BytesIO()
+    rewrite_xml(visible, 'odt', io.BytesIO(odt.encode('utf-8')), out)
+    assert out.getvalue().decode('utf-8') == odt.replace(
+        'საქართველო', 'სა\u00ADქარ\u00ADთვე\u00ADლო')
+    assert visible.hyphen_char == '-'
+    print('ok - ODT breaks are soft hyphens')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        docx = os.path.join(tmp, 'in.docx')
+        with zipfile.ZipFile(docx, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr('[Content_Types].xml', '<Types/>')
+            z.writestr('word/document.xml',
+                       '<w:document><w:body><w:p><w:r><w:t>ქართული</w:t>'
+                       '<w:instrText>ქართული</w:instrText></w:r></w:p>'
+                       '</w:body></w:document>')
+            z.writestr('word/media/image1.png', b'\x89PNG' + bytes(500))
+        h.hyphenate_document(docx, os.path.join(tmp, 'out.docx'))
+        with zipfile.ZipFile(docx) as zin, \
+                zipfile.ZipFile(os.path.join(tmp, 'out.docx')) as zout:
+            assert zout.testzip() is None
+            assert zout.read('word/document.xml').decode('utf-8') == (
+                '<w:document><w:body><w:p><w:r><w:t>ქარ</w:t><w:softHyphen/>'
+                '<w:t xml:space="preserve">თუ</w:t><w:softHyphen/>'
+                '<w:t xml:space="preserve">ლი</w:t>'
+                '<w:instrText>ქართული</w:instrText></w:r></w:p>'
+                '</w:body></w:document>')
+            image_in = zin.getinfo('word/media/image1.png')
+            image_out = zout.getinfo('word/media/image1.png')
+            assert image_out.compress_size == image_in.compress_size
+            assert zout.read('word/media/image1.png') == zin.read('word/media/image1.png')
+        print('ok - DOCX w:t runs get <w:softHyphen/>, media copied raw')
+
+        # Word splits words across runs; breaks follow the whole word
+        split = ('<w:document><w:body><w:p><w:r><w:t>ქა</w:t></w:r>'
+                 '<w:proofErr w:type="spellStart"/><w:r w:rsidR="00A1"><w:t>რთული</w:t></w:r>'
+                 '<w:proofErr w:type="spellEnd"/><w:r><w:t xml:space="preserve"> გამარჯ</w:t>'
+                 '</w:r><w:r><w:t>ობა</w:t><w:tab/><w:t>ენა</w:t></w:r></w:p></w:body></w:document>')
+        sh = '<w:softHyphen/><w:t xml:space="preserve">'
+        expected = ('<w:document><w:body><w:p><w:r><w:t>ქა</w:t></w:r>'
+                    '<w:proofErr w:type="spellStart"/><w:r w:rsidR="00A1"><w:t>რ</w:t>' + sh +
+                    'თუ</w:t>' + sh + 'ლი</w:t></w:r>'
+                    '<w:proofErr w:type="spellEnd"/><w:r><w:t xml:space="preserve"> გა</w:t>' + sh +
+                    'მარ</w:t>' + sh + 'ჯ</w:t></w:r><w:r><w:t>ო</w:t>' + sh +
+                    'ბა</w:t><w:tab/><w:t>ენა</w:t></w:r></w:p></w:body></w:document>')
+        for chunk_size in (1, 7, 1 << 16):
+            out = io.BytesIO()
+            rewrite_xml(h, 'docx', io.BytesIO(split.encode('utf-8')), out, chunk_size)
+            assert out.getvalue().decode('utf-8') == expected, chunk_size
+        print('ok - DOCX words split across runs are hyphenated as a whole')
+
+        epub = os.path.join(tmp, 'in.epub')
+        chapter = '<html><body><p>საქართველო</p></body></html>'
+        with zipfile.ZipFile(epub, 'w', zipfile.ZIP_DEFLATED) as z:
+            z.writestr(zipfile.ZipInfo('mimetype'), 'application/epub+zip')
+            for i in range(3):
+                z.writestr('OEBPS/ch%d.xhtml' % i, chapter)
+        for workers in (None, 2):
+            out = os.path.join(tmp, 'out-%s.epub' % workers)
+            assert h.hyphenate_document(epub, out, workers=workers) == 3
+            with zipfile.ZipFile(out) as z:
+                assert z.namelist()[0] == 'mimetype'
+                assert z.getinfo('mimetype').compress_type == zipfile.ZIP_STORED
+                for i in range(3):
+                    assert z.read('OEBPS/ch%d.xhtml' % i).decode('utf-8') == \
+                        chapter.replace('საქართველო', h.hyphenate('საქართველო'))
+        print('ok - EPUB chapters hyphenated (sequential and parallel)')
+
+
+def test_shared_tables():
+    """Workers attached to shared tables hyphenate like private copies"""
+    print_section('15. SHARED TABLES')
+
+    import pickle
+    import tempfile
+    from georgian_hyphenation import SharedTables
+
+    h = GeorgianHyphenator('-')
+    h.load_default_library()
+    h.add_harmonic_cluster('სტ')
+    words = list(h.dictionary) + ['გამარჯობა', 'ბასტა', '(კომპიუტერი)', 'abc']
+
+    tables = SharedTables.create(h)
+    try:
+        worker_tables = SharedTables.attach(tables.name)
+        worker = GeorgianHyphenator('-').use_shared_tables(worker_tables)
+        assert len(worker_tables) == h.get_dictionary_size()
+        assert dict(worker_tables) == h.dictionary
+        assert worker.harmonic_clusters == h.harmonic_clusters
+        assert worker.config_fingerprint() == h.config_fingerprint()
+        # The fingerprint comes from the header, without walking the table
+        def walked(self):
+            raise AssertionError('config_fingerprint() walked the shared table')
+
+        iterate, SharedTables.__iter__ = SharedTables.__iter__, walked
+        try:
+            assert worker.set_hyphen_char('=').config_fingerprint() == \
+                GeorgianHyphenator('=').use_shared_tables(worker_tables).config_fingerprint()
+            worker.set_hyphen_char('-')
+        finally:
+            SharedTables.__iter__ = iterate
+        assert [worker.hyphenate(w) for w in words] == [h.hyphenate(w) for w in words]
+        assert 'არარსებული' not in worker_tables
+        print('ok - attached worker matches private dictionary')
+
+        clone = pickle.loads(pickle.dumps(worker))
+        assert clone.hyphenate('კომპიუტერი') == 'კომ-პიუ-ტე-რი'
+        clone.dictionary.close()
+        worker_tables.close()
+        print('ok - hyphenator pickles by re-attaching')
+    finally:
+        tables.close()
+        tables.unlink()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with SharedTables.create_file(h, os.path.join(tmp, 'tables.bin')) as owner:
+            with SharedTables.attach_file(owner.name) as mapped:
+                assert mapped.get('კომპიუტერი') == 'კომ-პიუ-ტე-რი'
+        assert not os.path.exists(os.path.join(tmp, 'tables.bin'))
+    print('ok - memory-mapped file variant')
+
+    # Keys with characters outside U+10D0..U+10FF must still be found
+    mixed = GeorgianHyphenator('-')
+    for word in ('Აბ', 'Ბა', '1ბ', '2ა', 'ა-ბ', 'ა-ა', 'აბcd', 'აბა', 'ბ'):
+        mixed.add_exception(word, word)
+    with SharedTables.create(mixed) as owner:
+        assert all(word in owner and owner[word] == word for word in mixed.dictionary)
+        assert 'Აა' not in owner and 'ა-გ' not in owner
+    print('ok - non-Georgian characters keep lookups ordered')
+
+
+def test_regex_engine():
+    """The regex engine reproduces the default engine exactly"""
+    print_section('16. REGEX ENGINE')
+
+    import random
+    rng = random.Random(31)
+    consonants = 'ბგდვზთკლმნპჟრსტფქღყშჩცძწჭხჯჰ'
+    vowels = 'აეიოუ'
+
+    def random_word():
+        word = ''
+        for _ in range(rng.randint(1, 6)):
+            run = ''.join(rng.choice(consonants) for _ in range(rng.choice([0, 1, 1, 2, 3, 4])))
+            if run and rng.random() < 0.2:
+                run += run[-1]
+            word += run + rng.choice(vowels) * rng.choice([1, 1, 2])
+        return word
+
+    words = [random_word() for _ in range(3000)]
+    text = ' '.join(words) + ' (კომპიუტერი), საქართველო! abc ა-ნა'
+
+    for left, right in [(2, 2), (1, 1), (3, 2), (1, 3), (4, 4)]:
+        h = GeorgianHyphenator('-').set_left_min(left).set_right_min(right)
+        h.load_default_library()
+        r = GeorgianHyphenator('-').set_left_min(left).set_right_min(right)
+        r.load_default_library()
+        r.set_engine('regex')
+        assert r.hyphenate_text(text) == h.hyphenate_text(text), (left, right)
+        mismatches = [w for w in words if r.hyphenate_text(w) != h.hyphenate_text(w)]
+        assert not mismatches, (left, right, mismatches[:5])
+    print(f'ok - {len(words)} random words agree for 5 left/right minimums')
+
+    h = GeorgianHyphenator('-')
+    r = GeorgianHyphenator('-').set_engine('regex')
+    for change in (lambda x: x.add_harmonic_cluster('სტ'),
+                   lambda x: x.set_left_min(3),
+                   lambda x: x.add_exception('ბასტა', 'ბას-ტა'),
+                   lambda x: x.set_hyphen_char('\u00AD')):
+        change(h)
+        change(r)
+        assert r.hyphenate_text(text) == h.hyphenate_text(text)
+    print('ok - expressions regenerate after configuration changes')
+
+    # The hyphen character is applied when joining: nothing is recompiled
+    rules, words_expr = r._engine._rules, r._engine._words
+    r.set_hyphen_char('=')
+    assert r.hyphenate_text(text) == h.set_hyphen_char('=').hyphenate_text(text)
+    assert r._engine._rules is rules and r._engine._words is words_expr
+    r.add_harmonic_cluster('ჩხ')
+    assert r.hyphenate_text(text) == h.add_harmonic_cluster('ჩხ').hyphenate_text(text)
+    assert r._engine._rules is not rules and r._engine._words is words_expr
+    print('ok - only the affected expression is rebuilt')
+
+    r.set_engine('default')
+    assert r._engine is None
+    print('ok - set_engine("default") restores the Python engine')
+
+
+def test_workload_recorder():
+    """Recorded traffic replays with the same shape"""
+    print_section('17. WORKLOAD CAPTURE AND REPLAY')
+
+    import gzip
+    import tempfile
+    from georgian_hyphenation.workload import (
+        WorkloadRecorder, load_workload, replay_workload)
+
+    text = 'საქართველო გამარჯობა გამარჯობა კომპიუტერი'
+    with tempfile.TemporaryDirectory() as tmp:
+        logs = {}
+        for mode in ('plain', 'hash', 'redact'):
+            logs[mode] = os.path.join(tmp, mode + '.ghwl')
+            h = GeorgianHyphenator('-')
+            h.load_default_library()
+            with WorkloadRecorder(logs[mode], text_mode=mode) as recorder:
+                h.set_recorder(recorder)
+                for _ in range(20):
+                    assert h.hyphenate_text(text) == 'სა-ქარ-თვე-ლო გა-მარ-ჯო-ბა გა-მარ-ჯო-ბა კომ-პიუ-ტე-რი'
+                    h.hyphenate('გამარჯობა')
+                    h.hyphenate_html('<p>გამარჯობა</p>')
+                h.set_left_min(3)
+                h.hyphenate('გამარჯობა')
+            assert recorder.calls == recorder.recorded == 61
+        print('ok - nested calls are recorded once')
+
+        plain = load_workload(logs['plain'])
+        hashed = load_workload(logs['hash'])
+        redacted = load_workload(logs['redact'])
+        assert len(plain.configs) == 2 and plain.configs[1]['left_min'] == 3
+        assert plain.calls[0].text == text
+        assert [c.kind for c in plain.calls[:3]] == ['hyphenate_text', 'hyphenate', 'hyphenate_html']
+        assert sorted(hashed.word_frequencies().values()) == sorted(plain.word_frequencies().values())
+        assert [len(c.text) for c in hashed.calls] == [len(c.text) for c in redacted.calls]
+        assert [len(c.text) for c in hashed.calls] == [len(c.text) for c in plain.calls]
+        with gzip.open(logs['hash'], 'rb') as f:
+            assert 'გამარჯობა'.encode('utf-8') not in f.read()
+        print('ok - hashed logs keep word frequencies, not text')
+
+        # Markup and punctuation survive; other letters and digits are masked
+        page = '<p class="lead">გამარჯობა, Tbilisi 2024!</p><code>საქართველო</code>'
+        masked = os.path.join(tmp, 'masked.ghwl')
+        with WorkloadRecorder(masked, text_mode='hash') as recorder:
+            GeorgianHyphenator().set_recorder(recorder).hyphenate_html(page)
+        replayed = load_workload(masked).calls[0].text
+        assert len(replayed) == len(page)
+        assert re.fullmatch('<p xxxxx="xxxx">[ა-ჰ]{9}, xxxxxxx 0000!</p><code>[ა-ჰ]{10}</code>',
+                            replayed), replayed
+        print('ok - replayed HTML keeps its markup skeleton')
+
+        h = GeorgianHyphenator('-').set_engine('regex')
+        h.load_default_library()
+        report = replay_workload(plain, h, repeat=2, recorded_config=True)
+        assert report['calls'] == 122 and report['words'] == 2 * 121
+        assert report['fingerprint_match']
+        assert h.left_min == 3
+        assert set(report['by_kind']) == {'hyphenate', 'hyphenate_text', 'hyphenate_html'}
+        assert report['latency_us']['p50'] <= report['latency_us']['p99'] <= report['latency_us']['max']
+        print('ok - replay reports throughput and latency percentiles')
+
+        sampled = os.path.join(tmp, 'sampled.ghwl')
+        with WorkloadRecorder(sampled, sample_rate=0.0) as recorder:
+            GeorgianHyphenator().set_recorder(recorder).hyphenate_text(text)
+        assert (recorder.calls, recorder.recorded) == (1, 0)
+        assert load_workload(sampled).calls == []
+        print('ok - sample_rate controls what is recorded')
+
+        # A worker killed before close() leaves a gzip stream without its
+        # end marker: records up to the last flush still load
+        import shutil
+        crashed = os.path.join(tmp, 'crashed.ghwl')
+        recorder = WorkloadRecorder(logs['plain'] + '.live', flush_every=100)
+        h = GeorgianHyphenator('-').set_recorder(recorder)
+        for i in range(1050):
+            h.hyphenate_text('%s %d' % (text, i))
+        shutil.copyfile(recorder.path, crashed)
+        recorder.close()
+        workload = load_workload(crashed)
+        assert workload.truncated and len(workload.calls) == 1000
+        assert workload.calls[-1].text == '%s 999' % text
+        assert workload.summary()['truncated']
+        complete = load_workload(recorder.path)
+        assert not complete.truncated and len(complete.calls) == 1050
+
+        # Cut anywhere, a log yields a prefix of its complete records
+        with open(recorder.path, 'rb') as f:
+            data = f.read()
+        previous = 0
+        for cut in range(len(data) // 3, len(data), max(1, len(data) // 17)):
+            with open(crashed, 'wb') as f:
+                f.write(data[:cut])
+            calls = load_workload(crashed).calls
+            assert [c.text for c in calls] == [c.text for c in complete.calls[:len(calls)]]
+            assert len(calls) >= previous
+            previous = len(calls)
+        assert previous > 0
+        print('ok - truncated logs load their complete records')
+
+
+def test_hyphenate_tree():
+    """Element trees are hyphenated in place like hyphenate_html()"""
+    print_section('18. ELEMENT TREES')
+
+    import xml.etree.ElementTree as ET
+
+    h = GeorgianHyphenator('-')
+    h.load_default_library()
+    html = ('<div><p>საქართველო <b>გამარჯობა</b> კომპიუტერი<!-- საქართველო --></p>'
+            '<pre>საქართველო</pre>გამარჯობა<CODE>გამარჯობა</CODE>'
+            '<script>var x = "საქართველო";</script></div>')
+
+    root = ET.fromstring(html)
+    assert h.hyphenate_tree(root) is root
+    expected = ET.tostring(ET.fromstring(h.hyphenate_html(html)), encoding='unicode')
+    assert ET.tostring(root, encoding='unicode') == expected
+    assert root.find('p').text == 'სა-ქარ-თვე-ლო '
+    assert root.find('pre').tail == 'გა-მარ-ჯო-ბა'
+    assert root.find('CODE').text == 'გამარჯობა'
+    print('ok - same result as hyphenate_html() without re-parsing')
+
+    ns = '{http://www.w3.org/1999/xhtml}'
+    root = ET.fromstring(
+        '<html xmlns="http://www.w3.org/1999/xhtml"><body>'
+        '<p lang="en">საქართველო</p><p class="x no-hyphens">საქართველო</p>'
+        '<p><code>გამარჯობა</code>საქართველო</p></body></html>')
+    h.hyphenate_tree(root, skip=lambda el: el.get('lang', 'ka') != 'ka'
+                     or 'no-hyphens' in el.get('class', '').split())
+    paragraphs = root.findall('.//%sp' % ns)
+    assert [p.text for p in paragraphs] == ['საქართველო', 'საქართველო', None]
+    assert paragraphs[2].find('%scode' % ns).text == 'გამარჯობა'
+    assert paragraphs[2].find('%scode' % ns).tail == 'სა-ქარ-თვე-ლო'
+    print('ok - skip predicate and namespaced tags')
+
+
+def test_compact_export():
+    """Compact artifact round-trips and matches the npm copy"""
+    print_section('19. COMPACT EXPORT')
+
+    import json
+    from georgian_hyphenation.compact import (
+        export_compact, read_compact, compact_fingerprint)
+
+    h = GeorgianHyphenator('-')
+    h.load_default_library()
+    h.add_exception('გრძელისიტყვამრავალიმარცვლით', 'გრძე-ლი-სიტ-ყვა-მრა-ვა-ლი-მარ-ცვლით')
+    artifact = export_compact(h)
+    dictionary, clusters, fingerprint = read_compact(artifact)
+    assert dictionary == h.dictionary
+    assert clusters == h.harmonic_clusters
+    assert fingerprint == compact_fingerprint(h)
+    assert len(artifact) < len(json.dumps(h.dictionary, ensure_ascii=False).encode('utf-8')) / 3
+    print(f'ok - {len(dictionary)} entries round-trip in {len(artifact)} bytes')
+
+    h.remove_exception('გრძელისიტყვამრავალიმარცვლით')
+    npm_copy = os.path.join(os.path.dirname(__file__), '..', 'npm', 'data', 'exceptions.ghd')
+    if os.path.exists(npm_copy):
+        with open(npm_copy, 'rb') as f:
+            assert f.read() == export_compact(h), 'npm/data/exceptions.ghd is stale'
+        print('ok - npm artifact matches the bundled dictionary')
+
+    try:
+        read_compact(artifact[:-1] + b'\x00')
+        assert False, 'corrupt artifact accepted'
+    except ValueError:
+        pass
+    try:
+        export_compact(GeorgianHyphenator().add_exception('abc', 'a-bc'))
+        assert False, 'non-Georgian key accepted'
+    except ValueError:
+        pass
+    print('ok - corrupt data and non-Georgian keys are rejected')
+
+
+def test_fragment_cache():
+    """Fragment cache returns identical output and stays within its budget"""
+    print_section('20. FRAGMENT CACHE')
+
+    from georgian_hyphenation import FragmentCache
+
+    page = ('<nav>მთავარი გვერდი · ჩვენს შესახებ</nav>'
+            '<p>საქართველო მდებარეობს ამიერკავკასიაში</p>'
+            '<footer>ყველა უფლება დაცულია</footer>')
+    plain = GeorgianHyphenator('-')
+    fragments = FragmentCache(max_bytes=64 * 1024)
+    h = GeorgianHyphenator('-').set_fragment_cache(fragments)
+    for _ in range(3):
+        assert h.hyphenate_html(page) == plain.hyphenate_html(page)
+    stats = fragments.stats()
+    assert stats['misses'] == 3 and stats['hits'] == 6, stats
+    assert abs(fragments.hit_rate() - 2 / 3) < 1e-9
+    print(f"ok - repeated page served from cache (hit rate {stats['hit_rate']:.2f})")
+
+    # Another configuration sharing the cache never sees these results
+    other = GeorgianHyphenator('=').set_fragment_cache(fragments)
+    assert other.hyphenate_text('საქართველო') == 'სა=ქარ=თვე=ლო'
+    h.add_exception('საქართველო', 'საქართ-ველო')
+    assert h.hyphenate_text('საქართველო') == 'საქართ-ველო'
+    print('ok - entries are keyed by configuration fingerprint')
+
+    # In-place edits of the public containers are seen by every cache and
+    # both engines, same length or not
+    import tempfile
+    from georgian_hyphenation import PersistentCache
+    with tempfile.TemporaryDirectory() as tmp:
+        with PersistentCache(os.path.join(tmp, 'cache.sqlite3')) as cache:
+            for engine in ('default', 'regex'):
+                e = (GeorgianHyphenator('-').set_engine(engine).set_cache(cache)
+                     .set_fragment_cache(FragmentCache()))
+                e.load_default_library()
+                fingerprint = e.config_fingerprint()
+                original = e.dictionary['საქართველო']
+                assert e.hyphenate_text('კანდელი საქართველო') == 'კან-დე-ლი სა-ქარ-თვე-ლო'
+                e.dictionary['საქართველო'] = 'საქართ-ველო'
+                e.harmonic_clusters.discard('ბრ')
+                e.harmonic_clusters.add('ნდ')
+                assert e.hyphenate_text('კანდელი საქართველო') == 'კა-ნდე-ლი საქართ-ველო'
+                assert e.hyphenate('საქართველო') == 'საქართ-ველო'
+                e.dictionary.update({'საქართველო': original})
+                e.harmonic_clusters -= {'ნდ'}
+                e.harmonic_clusters |= {'ბრ'}
+                assert e.hyphenate_text('კანდელი საქართველო') == 'კან-დე-ლი სა-ქარ-თვე-ლო'
+                assert e.config_fingerprint() == fingerprint
+    print('ok - in-place dictionary and cluster edits invalidate cached results')
+
+    small = FragmentCache(max_bytes=16 * 1024)
+    h.set_fragment_cache(small)
+    for i in range(200):
+        h.hyphenate_text('ტექსტი ნომერი %d' % i)
+    assert small.bytes <= small.max_bytes and small.evictions > 0
+    assert len(small) < 200
+    h.hyphenate_text('გრძელი ' * 1000)
+    assert ('გრძელი ' * 1000) not in [key[1] for key in small._entries]
+    print(f'ok - {len(small)} entries in {small.bytes} of {small.max_bytes} bytes, '
+          f'{small.evictions} evicted')
+
+
+def test_hyphenate_markdown():
+    """Markdown prose is hyphenated, code/HTML/URLs are not, in any chunking"""
+    print_section('21. MARKDOWN')
+
+    h = GeorgianHyphenator('-')
+    source = (
+        '# საქართველო\n'
+        '\n'
+        'საქართველო `საქართველო` [საქართველო](https://ka.example/საქართველო "საქართველო")\n'
+        'და <https://ka.example/საქართველო> <b>საქართველო</b> <code>საქართველო</code>\n'
+        '\n'
+        '```\n'
+        'საქართველო\n'
+        '```\n'
+        '\n'
+        '    საქართველო\n'
+        '\n'
+        '<div>\n'
+        'საქართველო\n'
+        '</div>\n'
+        '\n'
+        '- საქართველო\n'
+        '> საქართველო `კოდი\n'
+        '> საქართველო` საქართველო\r\n'
+        '[საქართველო]: https://ka.example/საქართველო')
+    expected = (
+        '# სა-ქარ-თვე-ლო\n'
+        '\n'
+        'სა-ქარ-თვე-ლო `საქართველო` [სა-ქარ-თვე-ლო](https://ka.example/საქართველო "საქართველო")\n'
+        'და <https://ka.example/საქართველო> <b>სა-ქარ-თვე-ლო</b> <code>საქართველო</code>\n'
+        '\n'
+        '```\n'
+        'საქართველო\n'
+        '```\n'
+        '\n'
+        '    საქართველო\n'
+        '\n'
+        '<div>\n'
+        'საქართველო\n'
+        '</div>\n'
+        '\n'
+        '- სა-ქარ-თვე-ლო\n'
+        '> სა-ქარ-თვე-ლო `კოდი\n'
+        '> საქართველო` სა-ქარ-თვე-ლო\r\n'
+        '[სა-ქარ-თვე-ლო]: https://ka.example/საქართველო')
+    assert h.hyphenate_markdown(source) == expected
+    print('ok - only prose is hyphenated')
+
+    for size in (1, 3, 17, 4096):
+        chunks = (source[i:i + size] for i in range(0, len(source), size))
+        assert ''.join(h.hyphenate_markdown_stream(chunks)) == expected, size
+    print('ok - streamed chunks give the same output')
+
+    # A code span that never closes leaves the rest of its paragraph alone
+    assert h.hyphenate_markdown('`საქართველო\nსაქართველო\n\nსაქართველო') == \
+        '`საქართველო\nსაქართველო\n\nსა-ქარ-თვე-ლო'
+    print('ok - unterminated code span is left unhyphenated')
+
+
 def main():
     """Run all tests"""
     print('\n' + '🧪 Georgian Hyphenation Library - Python Test'.center(70))
@@ -245,6 +949,17 @@ def main():
         test_method_chaining()
         test_with_dictionary()
         test_regressions()
+        test_dictionary_minimizer()
+        test_persistent_cache()
+        test_corpus_statistics()
+        test_document_pipeline()
+        test_shared_tables()
+        test_regex_engine()
+        test_workload_recorder()
+        test_hyphenate_tree()
+        test_compact_export()
+        test_fragment_cache()
+        test_hyphenate_markdown()
 
         print('\n' + '='*70)
         print('✅ All tests completed successfully!'.center(70))